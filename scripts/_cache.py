@@ -0,0 +1,91 @@
+# coding=utf-8
+"""
+LLM 响应磁盘缓存
+
+为 generate_keywords.py 提供基于 SQLite 的响应缓存，
+相同 (system_prompt, prompt, model, temperature) 的请求在 TTL 内直接复用结果。
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "trendradar" / "keywords.db"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600  # 7 天
+
+
+class LLMCache:
+    """基于 SQLite 的 LLM 响应缓存"""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, ttl: int = DEFAULT_TTL_SECONDS):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, ts INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(system_prompt: str, prompt: str, model: str, temperature: float = 0) -> str:
+        """生成确定性的缓存键"""
+        payload = json.dumps(
+            {"sys": system_prompt, "prompt": prompt, "model": model, "temp": temperature},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """读取未过期的缓存，不存在或过期时返回 None"""
+        row = self._conn.execute(
+            "SELECT response, ts FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        response, ts = row
+        if self.ttl > 0 and time.time() - ts > self.ttl:
+            return None
+        return response
+
+    def set(self, key: str, response: str) -> None:
+        """写入缓存"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, response, ts) VALUES (?, ?, ?)",
+            (key, response, int(time.time())),
+        )
+        self._conn.commit()
+
+    async def get_or_set(
+        self,
+        key: str,
+        producer: Callable[[], Awaitable[str]],
+        should_cache: Callable[[str], bool] = lambda _: True,
+    ) -> str:
+        """
+        命中缓存则直接返回，否则调用 producer 生成并写入缓存
+
+        Args:
+            key: 缓存键
+            producer: 缓存未命中时调用的异步生成函数
+            should_cache: 判断结果是否应写入缓存（例如失败响应不缓存）
+
+        Returns:
+            缓存或新生成的响应内容
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        response = await producer()
+        if should_cache(response):
+            self.set(key, response)
+        return response
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        self._conn.close()
@@ -9,7 +9,10 @@ import sys
 import os
 import asyncio
 import argparse
+import re
+import string
 from pathlib import Path
+from typing import List, Tuple
 
 # 添加 src 到路径
 sys.path.append(str(Path(__file__).parent.parent / "src"))
@@ -17,10 +20,12 @@ sys.path.append(str(Path(__file__).parent.parent / "src"))
 from trendradar.core.loader import load_config
 from trendradar.core.llm_service import LLMService
 
+from _cache import LLMCache, DEFAULT_TTL_SECONDS
+
 PROMPT_TEMPLATE = """
 你是一个专业的新闻分析专家。我需要你为一个新闻监测系统生成“频率词过滤与分类规则”。
 
-【目标领域】：{domain}
+【目标领域】：${domain}
 
 【规则语法说明】：
 1. 分类包含逻辑：/正则表达式/ => 分类名称 (只有命中此规则的新闻才会保留并归类)
@@ -39,14 +44,26 @@ PROMPT_TEMPLATE = """
 !虚拟货币套路
 !杀猪盘
 
-现在，请为【{domain}】领域生成规则：
+现在，请为【${domain}】领域生成规则：
 """
 
+# 模块加载时预编译模板，多领域生成时避免重复解析 str.format 格式串
+_PROMPT_TPL = string.Template(PROMPT_TEMPLATE)
+
+# 匹配 Markdown 代码块围栏行（如 ``` 或 ```text）
+_CODE_FENCE_RE = re.compile(r"^[ \t]*```[^\n]*\n?", re.M)
+
 async def main():
     parser = argparse.ArgumentParser(description="AI 关键词自动生成工具")
-    parser.add_argument("domain", help="想要生成的领域描述（例如：低空经济、半导体等）")
+    parser.add_argument("domain", nargs="+", help="想要生成的领域描述，可传入多个（例如：低空经济 半导体）")
     parser.add_argument("--append", action="store_true", help="追加到现有文件而不是覆盖")
     parser.add_argument("-y", "--yes", action="store_true", help="自动确认并不再提示")
+    parser.add_argument("--no-cache", action="store_true", help="跳过本地响应缓存，强制重新请求 AI")
+    parser.add_argument(
+        "--cache-ttl", type=int, default=DEFAULT_TTL_SECONDS,
+        help=f"响应缓存有效期（秒），默认 {DEFAULT_TTL_SECONDS}"
+    )
+    parser.add_argument("--concurrency", type=int, default=8, help="多领域并发请求数上限，默认 8")
     args = parser.parse_args()
 
     # 1. 加载配置和 LLM
@@ -61,25 +78,77 @@ async def main():
         print(f"❌ 加载配置失败: {e}")
         return
 
-    # 2. 生成关键词
-    print(f"🚀 正在为领域【{args.domain}】生成关键词配置...")
-    prompt = PROMPT_TEMPLATE.format(domain=args.domain)
-    
+    # 2. 并发生成关键词
+    domains = args.domain
+    print(f"🚀 正在为 {len(domains)} 个领域【{'、'.join(domains)}】生成关键词配置...")
+
     system_prompt = "你是一个专业规则生成助手，只输出 frequency_words.txt 格式的规则。"
-    response = await llm.ask(prompt, system_prompt=system_prompt)
-    
-    if "Request failed" in response:
-        print(f"❌ AI 生成失败: {response}")
-        return
+    cache = None if args.no_cache else LLMCache(ttl=args.cache_ttl)
+    sem = asyncio.Semaphore(max(1, args.concurrency))
+
+    # 单领域时流式输出，尽早看到生成内容；多领域并发时输出会交错，仍等待完整回复
+    stream = len(domains) == 1
+
+    async def request(prompt: str) -> str:
+        if not stream:
+            return await llm.ask(prompt, system_prompt=system_prompt)
+
+        buf: List[str] = []
+        async for token in llm.ask_stream(prompt, system_prompt=system_prompt):
+            buf.append(token)
+            if "Request failed" in token:
+                break
+            sys.stdout.write(token)
+            sys.stdout.flush()
+        print()
+        return "".join(buf)
+
+    async def generate_one(domain: str) -> Tuple[str, str]:
+        prompt = _PROMPT_TPL.substitute(domain=domain)
+        async with sem:
+            if cache is None:
+                return domain, await request(prompt)
+            key = LLMCache._key(system_prompt, prompt, llm.model, llm.temperature)
+            response = await cache.get_or_set(
+                key,
+                lambda: request(prompt),
+                should_cache=lambda r: "Request failed" not in r,
+            )
+            return domain, response
 
-    # 清理响应内容
-    lines = [line.strip() for line in response.split("\n") if line.strip() and not line.startswith("```")]
-    cleaned_content = "\n".join(lines)
+    try:
+        results = await asyncio.gather(
+            *[generate_one(d) for d in domains], return_exceptions=True
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+
+    blocks: List[Tuple[str, str]] = []
+    for domain, result in zip(domains, results):
+        if isinstance(result, BaseException):
+            print(f"❌ 领域【{domain}】AI 生成失败: {result}")
+            continue
+        _, response = result
+        if "Request failed" in response:
+            print(f"❌ 领域【{domain}】AI 生成失败: {response}")
+            continue
+
+        # 清理响应内容
+        stripped = _CODE_FENCE_RE.sub("", response)
+        cleaned_content = "\n".join(filter(None, (line.strip() for line in stripped.splitlines())))
+        blocks.append((domain, cleaned_content))
+
+    if not blocks:
+        return
 
     print("\n" + "="*40)
     print("✨ AI 生成的规则预览：")
-    print("-" * 40)
-    print(cleaned_content)
+    for domain, cleaned_content in blocks:
+        print("-" * 40)
+        if len(blocks) > 1:
+            print(f"# 领域: {domain}")
+        print(cleaned_content)
     print("="*40 + "\n")
 
     # 3. 写入文件
@@ -99,13 +168,20 @@ async def main():
 
     mode = "a" if args.append and target_path.exists() else "w"
     
+    # 所有领域先拼接到一个缓冲区，再一次性写入
+    parts: List[str] = []
+    for i, (domain, cleaned_content) in enumerate(blocks):
+        # 追加模式或多领域时，每个领域使用独立的分隔头
+        if mode == "a" or i > 0:
+            parts.append("\n\n")
+        if mode == "a" or len(blocks) > 1:
+            parts.append(f"# --- AI 增加领域: {domain} ---\n")
+        parts.append(cleaned_content)
+        parts.append("\n")
+
     try:
-        with open(target_path, mode, encoding="utf-8") as f:
-            if mode == "a":
-                f.write("\n\n")
-                f.write(f"# --- AI 增加领域: {args.domain} ---\n")
-            f.write(cleaned_content)
-            f.write("\n")
+        with open(target_path, mode, encoding="utf-8", buffering=1 << 16) as f:
+            f.write("".join(parts))
         
         print(f"✅ 成功写入 {target_path} (模式: {'追加' if mode == 'a' else '重写'})")
     except Exception as e:
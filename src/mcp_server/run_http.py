@@ -1,35 +1,263 @@
 import uvicorn
 from fastapi.staticfiles import StaticFiles
-from mcp_server.server import mcp
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse
+import gzip
+import mimetypes
 import os
+import shutil
+import stat
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
 
-# 尝试获取 underlying FastAPI app
-# FastMCP 可能将 app 存储在 internal attributes 中
-app = None
-if hasattr(mcp, "_fastapi_app"):
-    app = mcp._fastapi_app
-elif hasattr(mcp, "fastapi_app"):
-    app = mcp.fastapi_app
-elif hasattr(mcp, "_app"):
-    app = mcp._app
-
-if app:
-    # 挂载图片缓存目录
-    # 假设运行目录在项目根目录
-    cache_dir = os.path.join("output", "cache", "images")
-    if os.path.exists(cache_dir):
-        app.mount("/images", StaticFiles(directory=cache_dir), name="images")
-        print(f"挂载静态目录: /images -> {cache_dir}")
+# FastMCP 可能将 underlying FastAPI app 存储在以下 internal attributes 中（按优先级）
+_APP_ATTRS = ("_fastapi_app", "fastapi_app", "_app")
+
+
+def _resolve_app(server):
+    """按优先级解析 FastAPI app，未找到时返回 None"""
+    for name in _APP_ATTRS:
+        candidate = getattr(server, name, None)
+        if candidate is not None:
+            return candidate
+    return None
+
+
+# 缓存图片以 URL 哈希命名，内容不会变化，允许客户端长期缓存
+IMAGE_CACHE_CONTROL = "public, max-age=604800, immutable"
+
+
+# 图片目录索引的刷新间隔（秒）
+IMAGE_INDEX_TTL = 60
+
+# 未压缩的图片格式，预先生成 .gz 副本；jpg/png/gif/webp 本身已压缩，gzip 无收益
+GZIP_SUFFIXES = (".bmp", ".tiff")
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """按 q 值解析 Accept-Encoding，判断客户端是否接受 gzip（q=0 表示拒绝）"""
+    wildcard_q = None
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ("gzip", "x-gzip"):
+            return q > 0
+        if coding == "*":
+            wildcard_q = q
+    return wildcard_q is not None and wildcard_q > 0
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    图片缓存目录的静态文件服务
+
+    - 启动时用 os.scandir 建立 {文件名: stat} 索引，按 TTL 惰性刷新；
+      命中的文件请求时重新 stat（已被清理的文件移出索引并返回 404），
+      未命中时回退到默认查找并补入索引
+    - 附加长期 Cache-Control（ETag/304 由 Starlette 处理）
+    - 未压缩格式在启动时生成 .gz 副本，客户端支持时以 Content-Encoding: gzip 返回
+    - HEAD 与 Range 请求由 Starlette 的 StaticFiles/FileResponse 原生支持
+    """
+
+    def __init__(self, *args, index_ttl: float = IMAGE_INDEX_TTL, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.index_ttl = index_ttl
+        self._index = {}
+        self._index_built_at = 0.0
+        self._refresh_index()
+        # .gz 副本只在启动时生成一次，请求路径上不写文件
+        self._precompress(self._index)
+
+    def _refresh_index(self) -> None:
+        """重建目录索引（顶层文件及 YYYY-MM-DD 日期子目录中的文件）"""
+        index = {}
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        index[entry.name] = entry.stat()
+                    elif entry.is_dir(follow_symlinks=False):
+                        with os.scandir(entry.path) as sub_entries:
+                            for sub in sub_entries:
+                                if sub.is_file(follow_symlinks=False):
+                                    index[os.path.join(entry.name, sub.name)] = sub.stat()
+        except OSError:
+            pass
+        self._index = index
+        self._index_built_at = time.monotonic()
+
+    def _precompress(self, index) -> None:
+        """为未压缩格式生成（或更新）.gz 副本，并加入索引（先写临时文件再原子替换）"""
+        for rel_path, stat_result in list(index.items()):
+            if not rel_path.lower().endswith(GZIP_SUFFIXES):
+                continue
+            gz_rel_path = rel_path + ".gz"
+            gz_stat = index.get(gz_rel_path)
+            if gz_stat is not None and gz_stat.st_mtime_ns >= stat_result.st_mtime_ns:
+                continue
+            src = os.path.join(self.directory, rel_path)
+            dst = os.path.join(self.directory, gz_rel_path)
+            tmp_path = None
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(dst), suffix=".tmp")
+                with open(src, "rb") as f_in, os.fdopen(fd, "wb") as raw_out:
+                    with gzip.GzipFile(fileobj=raw_out, mode="wb", compresslevel=6) as f_out:
+                        shutil.copyfileobj(f_in, f_out)
+                os.replace(tmp_path, dst)
+                index[gz_rel_path] = os.stat(dst)
+            except OSError:
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                continue
+
+    def lookup_path(self, path):
+        # 隐藏文件、目录穿越等交给 Starlette 默认逻辑（含目录穿越检查）
+        if not path or path.startswith((".", "/", "\\")):
+            return super().lookup_path(path)
+
+        if time.monotonic() - self._index_built_at > self.index_ttl:
+            self._refresh_index()
+
+        if path in self._index:
+            # 索引可能已过期（文件被 ImageCache.cleanup 删除或被替换），重新 stat
+            full_path = os.path.join(self.directory, path)
+            try:
+                stat_result = os.stat(full_path)
+            except OSError:
+                self._index.pop(path, None)
+            else:
+                self._index[path] = stat_result
+                return full_path, stat_result
+
+        # 索引刷新后新缓存的图片：回退到默认查找，命中的文件补入索引
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+            self._index[path] = stat_result
+        return full_path, stat_result
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        if full_path.lower().endswith(GZIP_SUFFIXES):
+            response = self._gzip_response(full_path, stat_result, scope, status_code)
+            if response is not None:
+                return response
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = IMAGE_CACHE_CONTROL
+        if full_path.lower().endswith(GZIP_SUFFIXES):
+            # 同一 URL 存在 gzip 与原始两种表示，共享缓存需按 Accept-Encoding 区分
+            response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    def _gzip_response(self, full_path, stat_result, scope, status_code):
+        """客户端接受 gzip 且存在不旧于原文件的预压缩副本时返回 .gz 文件，否则返回 None"""
+        request_headers = Headers(scope=scope)
+        if not _accepts_gzip(request_headers.get("accept-encoding", "")):
+            return None
+        gz_rel_path = os.path.relpath(full_path, self.directory) + ".gz"
+        if gz_rel_path not in self._index:
+            return None
+        try:
+            gz_stat = os.stat(full_path + ".gz")
+        except OSError:
+            self._index.pop(gz_rel_path, None)
+            return None
+        if gz_stat.st_mtime_ns < stat_result.st_mtime_ns:
+            return None
+
+        response = FileResponse(
+            full_path + ".gz",
+            status_code=status_code,
+            stat_result=gz_stat,
+            media_type=mimetypes.guess_type(full_path)[0],
+        )
+        response.headers["Content-Encoding"] = "gzip"
+        response.headers["Vary"] = "Accept-Encoding"
+        response.headers["Cache-Control"] = IMAGE_CACHE_CONTROL
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+def _use_orjson_responses(app) -> None:
+    """安装了 orjson 时，将 FastAPI 默认响应类切换为 ORJSONResponse"""
+    try:
+        import orjson  # noqa: F401
+        from fastapi.responses import ORJSONResponse
+    except ImportError:
+        return
+    router = getattr(app, "router", None)
+    if router is not None and hasattr(router, "default_response_class"):
+        router.default_response_class = ORJSONResponse
+
+
+@lru_cache(maxsize=1)
+def get_app():
+    """
+    延迟导入 MCP 服务并解析 FastAPI app（挂载图片缓存目录）
+
+    仅在真正需要时才触发 FastMCP 的完整初始化，导入本模块本身不产生该开销。
+
+    Returns:
+        FastAPI app，未找到时返回 None
+    """
+    from mcp_server.server import mcp
+
+    app = _resolve_app(mcp)
+    if app:
+        _use_orjson_responses(app)
+
+        # 挂载图片缓存目录
+        # 假设运行目录在项目根目录（与 ImageCache 的相对路径约定一致），启动时解析为绝对路径
+        cache_dir = Path("output", "cache", "images").resolve()
+        if cache_dir.is_dir():
+            app.mount("/images", CachedStaticFiles(directory=str(cache_dir)), name="images")
+            print(f"挂载静态目录: /images -> {cache_dir}")
+        else:
+            print(f"缓存目录不存在，跳过挂载: {cache_dir}")
     else:
-        print(f"缓存目录不存在，跳过挂载: {cache_dir}")
-else:
-    print("Warning: Could not find FastAPI app in mcp object")
+        print("Warning: Could not find FastAPI app in mcp object")
+    return app
+
+
+def _uvicorn_options():
+    """
+    优先使用 uvloop + httptools 提升静态图片服务吞吐，
+    未安装（如 Windows）时回退到 uvicorn 默认实现
+    """
+    options = {"workers": 1, "access_log": False}
+    try:
+        import uvloop  # noqa: F401
+        options["loop"] = "uvloop"
+    except ImportError:
+        pass
+    try:
+        import httptools  # noqa: F401
+        options["http"] = "httptools"
+    except ImportError:
+        pass
+    return options
+
 
 if __name__ == "__main__":
     # 直接运行
+    from mcp_server.server import mcp
+
+    app = get_app()
     if app:
         print("Starting custom MCP server with static files...")
-        uvicorn.run(app, host="0.0.0.0", port=3333)
+        uvicorn.run(app, host="0.0.0.0", port=3333, **_uvicorn_options())
     else:
         # Fallback to mcp.run if app extraction failed
         print("Fallback to standard mcp.run...")
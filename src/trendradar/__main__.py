@@ -6,66 +6,172 @@ TrendRadar 主程序
 支持: python -m trendradar
 """
 
+import json
 import os
+import re
+import time
 import webbrowser
+from collections import ChainMap
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 
 import asyncio
-import requests
+import httpx
 import logging
 
-from trendradar.context import AppContext
+from trendradar.context import AppContext, create_http_client
 from trendradar import __version__
 from trendradar.core import load_config
+from trendradar.core.constants import CONCURRENCY
 from trendradar.core.analyzer import convert_keyword_stats_to_platform_stats
 from trendradar.crawler import AsyncDataFetcher
 from trendradar.storage import convert_crawl_results_to_news_data
-from trendradar.utils.time import is_within_days
+from trendradar.utils.time import get_configured_time, is_within_days
 from trendradar.notification.coordinator import NotificationCoordinator
 
 
-def check_version_update(
-    current_version: str, version_url: str, proxy_url: Optional[str] = None
-) -> Tuple[bool, Optional[str]]:
-    """检查版本更新"""
+VERSION_CACHE_PATH = Path.home() / ".cache" / "trendradar" / "version.json"
+VERSION_CACHE_TTL = 86400  # 24小时
+
+_VERSION_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "text/plain, */*",
+    "Cache-Control": "no-cache",
+    "Accept-Encoding": "gzip",
+}
+
+
+_VERSION_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
+
+
+@lru_cache(maxsize=128)
+def _parse_version(version_str: str) -> Tuple[int, int, int]:
+    """解析 x.y.z 格式的版本号，格式不正确时返回 (0, 0, 0)"""
+    m = _VERSION_RE.match(version_str.strip())
+    if not m:
+        return 0, 0, 0
+    return int(m[1]), int(m[2]), int(m[3])
+
+
+def _compare_versions(current_version: str, remote_version: str) -> Tuple[bool, Optional[str]]:
+    """比较本地与远程版本，返回 (是否需要更新, 远程版本)"""
+    logging.getLogger("TrendRadar").info(f"当前版本: {current_version}, 远程版本: {remote_version}")
+
+    # 常见情况：已是最新版本，无需解析
+    if current_version.strip() == remote_version:
+        return False, None
+
+    need_update = _parse_version(current_version) < _parse_version(remote_version)
+    return need_update, remote_version if need_update else None
+
+
+def _read_version_cache(version_url: str) -> Optional[Dict]:
+    """读取远程版本缓存记录（不论是否过期），URL 不匹配或不存在时返回 None"""
+    try:
+        with open(VERSION_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("url") == version_url and "remote" in data and "ts" in data:
+            return data
+    except (OSError, ValueError, TypeError):
+        pass
+    return None
+
+
+def _is_version_cache_fresh(cached: Optional[Dict]) -> bool:
+    """缓存记录是否仍在 TTL 内"""
+    return cached is not None and time.time() - cached["ts"] < VERSION_CACHE_TTL
+
+
+def _conditional_headers(cached: Optional[Dict]) -> Dict[str, str]:
+    """根据缓存的 ETag / Last-Modified 构造条件请求头"""
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+
+def _write_version_cache(
+    version_url: str,
+    remote_version: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> None:
+    """原子写入远程版本缓存"""
     try:
-        proxies = None
-        if proxy_url:
-            proxies = {"http": proxy_url, "https": proxy_url}
-
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "text/plain, */*",
-            "Cache-Control": "no-cache",
-        }
-
-        response = requests.get(
-            version_url, proxies=proxies, headers=headers, timeout=10
+        VERSION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = VERSION_CACHE_PATH.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "ts": time.time(),
+                "url": version_url,
+                "remote": remote_version,
+                "etag": etag,
+                "last_modified": last_modified,
+            }, f)
+        os.replace(tmp_path, VERSION_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _handle_version_response(
+    response: httpx.Response, version_url: str, cached: Optional[Dict], write_cache: bool = True
+) -> str:
+    """处理版本检查响应：304 复用缓存，否则解析新版本并（按需）更新缓存"""
+    if response.status_code == 304 and cached:
+        remote_version = cached["remote"]
+        _write_version_cache(
+            version_url, remote_version, cached.get("etag"), cached.get("last_modified")
         )
-        response.raise_for_status()
+        return remote_version
+
+    response.raise_for_status()
+    remote_version = response.text.strip()
+    if write_cache:
+        _write_version_cache(
+            version_url,
+            remote_version,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+    return remote_version
 
-        remote_version = response.text.strip()
-        logging.getLogger("TrendRadar").info(f"当前版本: {current_version}, 远程版本: {remote_version}")
 
-        # 比较版本
-        def parse_version(version_str):
-            try:
-                parts = version_str.strip().split(".")
-                if len(parts) != 3:
-                    raise ValueError("版本号格式不正确")
-                return int(parts[0]), int(parts[1]), int(parts[2])
-            except Exception:
-                return 0, 0, 0
+async def check_version_update_async(
+    current_version: str,
+    version_url: str,
+    proxy_url: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None,
+    use_cache: bool = True,
+) -> Tuple[bool, Optional[str]]:
+    """
+    检查版本更新（异步版本，可与抓取流程并行执行）
 
-        current_tuple = parse_version(current_version)
-        remote_tuple = parse_version(remote_version)
+    未使用代理且提供了 client 时复用其连接池，否则用 create_http_client 临时创建客户端。use_cache 为 False 时不读写本地版本缓存
+    （GitHub Actions 每次运行的 ~/.cache 都是空的，缓存只会增加文件读写）。
+    """
+    try:
+        cached = _read_version_cache(version_url) if use_cache else None
+
+        if _is_version_cache_fresh(cached):
+            remote_version = cached["remote"]
+        else:
+            headers = {**_VERSION_HEADERS, **_conditional_headers(cached)}
+            if client is not None and not proxy_url:
+                response = await client.get(version_url, headers=headers, timeout=10)
+            else:
+                async with create_http_client(proxy=proxy_url) as temp_client:
+                    response = await temp_client.get(version_url, headers=headers, timeout=10)
+            remote_version = _handle_version_response(
+                response, version_url, cached, write_cache=use_cache
+            )
 
-        need_update = current_tuple < remote_tuple
-        return need_update, remote_version if need_update else None
+        return _compare_versions(current_version, remote_version)
 
     except Exception as e:
-        # 这里因为是静态函数且 logger 还没初始化好，暂时保持简单打印或使用 root logger
         logging.getLogger("TrendRadar").warning(f"版本检查失败: {e}")
         return False, None
 
@@ -126,10 +232,28 @@ class NewsAnalyzer:
 
         self.request_interval = self.ctx.config["REQUEST_INTERVAL"]
         self.report_mode = self.ctx.config["REPORT_MODE"]
+        # 报告模式在运行期间不变，策略只需解析一次
+        self._mode_strategy = self.MODE_STRATEGIES.get(
+            self.report_mode, self.MODE_STRATEGIES["daily"]
+        )
         self.rank_threshold = self.ctx.rank_threshold
+
+        # RSS 新鲜度过滤配置（静态配置，初始化时解析一次）
+        freshness_config = self.ctx.rss_config.get("FRESHNESS_FILTER", {})
+        self._freshness_enabled = freshness_config.get("ENABLED", True)
+        self._default_max_age_days = freshness_config.get("MAX_AGE_DAYS", 3)
+        self._feed_max_age_map = self._build_feed_max_age_map()
+        self._rss_feed_configs = self._build_rss_feed_configs() if self.ctx.rss_enabled else []
         self.is_github_actions = os.environ.get("GITHUB_ACTIONS") == "true"
-        self.is_docker_container = self._detect_docker_environment()
+        # 检测是否运行在 Docker 容器中（环境变量或 /.dockerenv 标记文件）
+        self.is_docker_container = (
+            os.environ.get("DOCKER_CONTAINER") == "true" or os.path.exists("/.dockerenv")
+        )
         self.update_info = None
+        # 单次运行内分析数据的缓存：(缓存键, 数据)，避免多个报告阶段重复读取存储
+        self._analysis_cache: Optional[Tuple[Tuple, Tuple]] = None
+        # 新增标题检测结果缓存：(缓存键, 新增标题)，同一批次数据只检测一次
+        self._new_titles_cache: Optional[Tuple[Tuple, Dict]] = None
         self.proxy_url = None
         self._setup_proxy()
         self.data_fetcher = AsyncDataFetcher(
@@ -158,8 +282,6 @@ class NewsAnalyzer:
         import atexit
         atexit.register(self.storage_manager.cleanup)
 
-        if self.is_github_actions:
-            self._check_version_update()
 
     def _init_storage_manager(self) -> None:
         """初始化存储管理器（使用 AppContext）"""
@@ -169,54 +291,49 @@ class NewsAnalyzer:
             # 环境变量覆盖配置
             self.ctx.config["STORAGE"]["RETENTION_DAYS"] = int(env_retention)
 
-        self.storage_manager = self.ctx.get_storage_manager()
+        self.storage_manager = self.ctx.storage_manager
         self.logger.info(f"存储后端: {self.storage_manager.backend_name}")
 
         retention_days = self.ctx.config.get("STORAGE", {}).get("RETENTION_DAYS", 0)
         if retention_days > 0:
             self.logger.info(f"数据保留天数: {retention_days} 天")
 
-    async def _cache_urls(self, urls: List[str]) -> None:
-        """批量缓存图片 URL (异步)"""
-        if not urls:
-            return
-
+    async def _cache_urls(self, urls: Iterable[str]) -> None:
+        """批量缓存图片 URL (异步)，接受任意可迭代对象（含生成器）"""
         try:
-            # 简单去重
-            unique_urls = list(set([u for u in urls if u and u.strip()]))
+            # 单次遍历去重（保持原有顺序）
+            unique_urls = list(dict.fromkeys(s for u in urls if u and (s := u.strip())))
             if not unique_urls:
                 return
 
             self.logger.info(f"[图片缓存] 开始处理 {len(unique_urls)} 张图片...")
             image_cache = self.storage_manager.get_image_cache()
 
-            tasks = []
-            for url in unique_urls:
-                tasks.append(image_cache.download(url))
-            
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
-
-        except Exception as e:
-            self.logger.error(f"[图片缓存] 异常: {e}")
+            # 限制同时进行的下载协程数量，避免一次性创建大量任务挤占连接池
+            semaphore = asyncio.Semaphore(
+                self.ctx.config.get("IMAGE_CACHE_CONCURRENCY", CONCURRENCY.IMAGE_CACHE_MAX_CONCURRENCY)
+            )
 
-    def _detect_docker_environment(self) -> bool:
-        """检测是否运行在 Docker 容器中"""
-        try:
-            if os.environ.get("DOCKER_CONTAINER") == "true":
-                return True
+            async def _download(url: str):
+                async with semaphore:
+                    return await image_cache.download(url)
 
-            if os.path.exists("/.dockerenv"):
-                return True
+            await asyncio.gather(*(_download(u) for u in unique_urls), return_exceptions=True)
 
-            return False
-        except Exception:
-            return False
+        except Exception as e:
+            self.logger.error(f"[图片缓存] 异常: {e}")
 
     def _should_open_browser(self) -> bool:
         """判断是否应该打开浏览器"""
         return not self.is_github_actions and not self.is_docker_container
 
+    def _open_in_browser(self, html_path: str, label: str) -> None:
+        """在本地浏览器中打开 HTML 报告（阻塞调用）"""
+        # absolute() 只拼接当前目录，不像 resolve() 那样逐级 stat 路径
+        file_url = Path(html_path).absolute().as_uri()
+        self.logger.info(f"正在打开{label}: {file_url}")
+        webbrowser.open(file_url)
+
     def _setup_proxy(self) -> None:
         """设置代理配置"""
         if not self.is_github_actions and self.ctx.config["USE_PROXY"]:
@@ -227,11 +344,15 @@ class NewsAnalyzer:
         else:
             self.logger.info("GitHub Actions环境，不使用代理")
 
-    def _check_version_update(self) -> None:
+    async def _check_version_update(self) -> None:
         """检查版本更新"""
         try:
-            need_update, remote_version = check_version_update(
-                __version__, self.ctx.config["VERSION_CHECK_URL"], self.proxy_url
+            need_update, remote_version = await check_version_update_async(
+                __version__,
+                self.ctx.config["VERSION_CHECK_URL"],
+                self.proxy_url,
+                client=self.ctx.http_client,
+                use_cache=not self.is_github_actions,
             )
 
             if need_update and remote_version:
@@ -247,7 +368,17 @@ class NewsAnalyzer:
 
     def _get_mode_strategy(self) -> Dict:
         """获取当前模式的策略配置"""
-        return self.MODE_STRATEGIES.get(self.report_mode, self.MODE_STRATEGIES["daily"])
+        return self._mode_strategy
+
+    def _detect_new_titles(self, platform_ids: List[str], quiet: bool = False) -> Dict:
+        """检测最新批次的新增标题（同一批次数据内复用检测结果）"""
+        cache_key = (self.ctx.format_date(), tuple(platform_ids))
+        if self._new_titles_cache is not None and self._new_titles_cache[0] == cache_key:
+            return self._new_titles_cache[1]
+
+        new_titles = self.ctx.detect_new_titles(platform_ids, quiet=quiet)
+        self._new_titles_cache = (cache_key, new_titles)
+        return new_titles
 
     def _load_analysis_data(
         self,
@@ -257,8 +388,14 @@ class NewsAnalyzer:
         try:
             # 获取当前配置的监控平台ID列表
             current_platform_ids = self.ctx.platform_ids
+
+            # 同一运行内数据不变时直接复用（按日期与平台列表区分）
+            cache_key = (self.ctx.format_date(), tuple(current_platform_ids))
+            if self._analysis_cache is not None and self._analysis_cache[0] == cache_key:
+                return self._analysis_cache[1]
+
             if not quiet:
-                self.logger.info(f"当前监控平台: {current_platform_ids}")
+                self.logger.info("当前监控平台: %s", current_platform_ids)
 
             all_results, id_to_name, title_info = self.ctx.read_today_titles(
                 current_platform_ids, quiet=quiet
@@ -268,14 +405,15 @@ class NewsAnalyzer:
                 self.logger.info("没有找到当天的数据")
                 return None
 
-            total_titles = sum(len(titles) for titles in all_results.values())
-            if not quiet:
-                self.logger.info(f"读取到 {total_titles} 个标题（已按当前监控平台过滤）")
+            # 标题总数仅用于日志，INFO 未启用时跳过统计
+            if not quiet and self.logger.isEnabledFor(logging.INFO):
+                total_titles = sum(len(titles) for titles in all_results.values())
+                self.logger.info("读取到 %d 个标题（已按当前监控平台过滤）", total_titles)
 
-            new_titles = self.ctx.detect_new_titles(current_platform_ids, quiet=quiet)
+            new_titles = self._detect_new_titles(current_platform_ids, quiet=quiet)
             word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
 
-            return (
+            analysis_data = (
                 all_results,
                 id_to_name,
                 title_info,
@@ -284,6 +422,8 @@ class NewsAnalyzer:
                 filter_words,
                 global_filters,
             )
+            self._analysis_cache = (cache_key, analysis_data)
+            return analysis_data
         except Exception as e:
             self.logger.error(f"数据加载失败: {e}")
             return None
@@ -325,9 +465,11 @@ class NewsAnalyzer:
         rss_new_items: Optional[List[Dict]] = None,
     ) -> Tuple[List[Dict], Optional[str]]:
         """统一的分析流水线：数据处理 → 统计计算 → HTML生成"""
+        ctx = self.ctx
+        config = ctx.config
 
         # 统计计算（使用 AppContext）
-        stats, total_titles = self.ctx.count_frequency(
+        stats, total_titles = ctx.count_frequency(
             data_source,
             word_groups,
             filter_words,
@@ -340,37 +482,30 @@ class NewsAnalyzer:
         )
 
         # === LLM 智能评分与过滤 ===
-        llm = self.ctx.get_llm_service()
+        llm = ctx.llm_service
         if llm.enabled and stats:
             if not quiet:
-                self.logger.info(f"[LLM] 开始智能分析 (模型: {llm.model})...")
+                self.logger.info("[LLM] 开始智能分析 (模型: %s)...", llm.model)
             
             # 1. 收集所有需要评分的标题
-            all_titles = set()
-            for stat in stats:
-                for title_data in stat["titles"]:
-                    all_titles.add(title_data["title"])
+            all_titles = {title_data["title"] for stat in stats for title_data in stat["titles"]}
             
             # 2. 批量评分
             if all_titles:
                 scores = await llm.score_titles(list(all_titles))
-                threshold = llm.config.get("score_threshold", 6.0)
+                threshold = llm.config.get("SCORE_THRESHOLD", 6.0)
+                get_score = scores.get
                 
                 # 3. 过滤低分文章
                 filtered_stats = []
                 filtered_count = 0
                 
                 for stat in stats:
-                    new_group_titles = []
-                    for title_data in stat["titles"]:
-                        title = title_data["title"]
-                        score = scores.get(title, 0.0)
-                        title_data["llm_score"] = score
-                        
-                        if score >= threshold:
-                            new_group_titles.append(title_data)
-                        else:
-                            filtered_count += 1
+                    group_titles = stat["titles"]
+                    for title_data in group_titles:
+                        title_data["llm_score"] = get_score(title_data["title"], 0.0)
+                    new_group_titles = [td for td in group_titles if td["llm_score"] >= threshold]
+                    filtered_count += len(group_titles) - len(new_group_titles)
                     
                     if new_group_titles:
                         stat["titles"] = new_group_titles
@@ -379,20 +514,20 @@ class NewsAnalyzer:
                 
                 stats = filtered_stats
                 if not quiet:
-                    self.logger.info(f"[LLM] 分析完成，过滤掉 {filtered_count} 条低质量内容 (阈值: {threshold})")
+                    self.logger.info("[LLM] 分析完成，过滤掉 %d 条低质量内容 (阈值: %s)", filtered_count, threshold)
 
         # 如果是 platform 模式，转换数据结构
-        if self.ctx.display_mode == "platform" and stats:
+        if ctx.display_mode == "platform" and stats:
             stats = convert_keyword_stats_to_platform_stats(
                 stats,
-                self.ctx.weight_config,
-                self.ctx.rank_threshold,
+                ctx.weight_config,
+                ctx.rank_threshold,
             )
 
         # HTML生成（如果启用）
         html_file = None
-        if self.ctx.config["STORAGE"]["FORMATS"]["HTML"]:
-            html_file = self.ctx.generate_html(
+        if config["STORAGE"]["FORMATS"]["HTML"]:
+            html_file = ctx.generate_html(
                 stats,
                 total_titles,
                 failed_ids=failed_ids,
@@ -400,7 +535,7 @@ class NewsAnalyzer:
                 id_to_name=id_to_name,
                 mode=mode,
                 is_daily_summary=is_daily_summary,
-                update_info=self.update_info if self.ctx.config["SHOW_VERSION_UPDATE"] else None,
+                update_info=self.update_info if config["SHOW_VERSION_UPDATE"] else None,
                 rss_items=rss_items,
                 rss_new_items=rss_new_items,
             )
@@ -535,15 +670,19 @@ class NewsAnalyzer:
             else:
                 ids.append(platform["id"])
 
-        self.logger.info(
-            f"配置的监控平台: {[p.get('name', p['id']) for p in self.ctx.platforms]}"
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "配置的监控平台: %s", [p.get("name", p["id"]) for p in self.ctx.platforms]
+            )
         self.logger.info("开始爬取数据 (并发模式)...")
         Path("output").mkdir(parents=True, exist_ok=True)
 
         results, id_to_name, failed_ids = await self.data_fetcher.crawl_websites(
             ids, self.request_interval
         )
+        # 新数据即将写入存储，之前缓存的分析数据与新增标题失效
+        self._analysis_cache = None
+        self._new_titles_cache = None
 
         # 转换为 NewsData 格式并保存到存储后端
         crawl_time = self.ctx.format_time()
@@ -554,29 +693,39 @@ class NewsAnalyzer:
 
         # 保存到存储后端（SQLite）
         if self.storage_manager.save_news_data(news_data):
-            self.logger.info(f"数据已保存到存储后端: {self.storage_manager.backend_name}")
+            self.logger.info("数据已保存到存储后端: %s", self.storage_manager.backend_name)
+
+        # 以下三个阶段互不依赖（网络 / DuckDB / 磁盘），并发执行：
+        # - 图片缓存下载
+        # - DuckDB 分析数据同步（sync_data_async 通过 asyncio.to_thread 运行，内部使用独立连接，线程安全）
+        # - TXT 快照写入（在线程中执行，避免阻塞事件循环）
+        outcomes = await asyncio.gather(
+            self._cache_news_images(news_data),
+            self._sync_analytics(),
+            asyncio.to_thread(self._save_txt_outputs, news_data, results, id_to_name, failed_ids),
+            return_exceptions=True,
+        )
+        # 图片缓存与 DuckDB 同步自行处理异常；TXT 写入失败保持原有行为向上抛出
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
 
-        # 触发图片缓存 (异步)
-        try:
-            image_urls = []
-            for src_items in news_data.items.values():
-                for item in src_items:
-                    if item.image_url:
-                        image_urls.append(item.image_url)
-            await self._cache_urls(image_urls)
-        except Exception as e:
-            self.logger.warning(f"[警告] 图片缓存触发失败: {e}")
+        return results, id_to_name, failed_ids
 
-        # 9. 同步 DuckDB 分析数据
+    async def _cache_news_images(self, news_data) -> None:
+        """触发热榜图片缓存（失败不影响主流程）"""
         try:
-            self.logger.info("[分析引擎] 正在同步数据到 DuckDB...")
-            analytics = self.storage_manager.get_analytics_engine()
-            # 使用 asyncio.to_thread 异步执行同步，避免阻塞主线程
-            # 注意：sync_data 内部使用了独立的 DuckDB 连接，因此是线程安全的
-            await analytics.sync_data_async(days=1)
+            await self._cache_urls(
+                item.image_url
+                for src_items in news_data.items.values()
+                for item in src_items
+                if item.image_url
+            )
         except Exception as e:
-            self.logger.warning(f"[分析引擎] 同步失败 (非致命): {e}")
+            self.logger.warning(f"[警告] 图片缓存触发失败: {e}")
 
+    def _save_txt_outputs(self, news_data, results: Dict, id_to_name: Dict, failed_ids: List) -> None:
+        """保存 TXT 快照及兼容格式的标题文件"""
         # 保存 TXT 快照（如果启用）
         txt_file = self.storage_manager.save_txt_snapshot(news_data)
         if txt_file:
@@ -587,7 +736,14 @@ class NewsAnalyzer:
             title_file = self.ctx.save_titles(results, id_to_name, failed_ids)
             self.logger.info(f"标题已保存到: {title_file}")
 
-        return results, id_to_name, failed_ids
+    async def _sync_analytics(self) -> None:
+        """同步 DuckDB 分析数据（失败不影响主流程）"""
+        try:
+            self.logger.info("[分析引擎] 正在同步数据到 DuckDB...")
+            analytics = self.storage_manager.get_analytics_engine()
+            await analytics.sync_data_async(days=1)
+        except Exception as e:
+            self.logger.warning(f"[分析引擎] 同步失败 (非致命): {e}")
 
     async def _crawl_rss_data(self) -> Tuple[Optional[List[Dict]], Optional[List[Dict]], Optional[List[Dict]]]:
         """
@@ -608,40 +764,14 @@ class NewsAnalyzer:
             return None, None, None
 
         try:
-            from trendradar.crawler.rss import AsyncRSSFetcher, RSSFeedConfig
-
-            # 构建 RSS 源配置
-            feeds = []
-            for feed_config in rss_feeds:
-                # 读取并验证单个 feed 的 max_age_days（可选）
-                max_age_days_raw = feed_config.get("max_age_days")
-                max_age_days = None
-                if max_age_days_raw is not None:
-                    try:
-                        max_age_days = int(max_age_days_raw)
-                        if max_age_days < 0:
-                            feed_id = feed_config.get("id", "unknown")
-                            self.logger.warning(f"[RSS] feed '{feed_id}' 的 max_age_days 为负数，将使用全局默认值")
-                            max_age_days = None
-                    except (ValueError, TypeError):
-                        feed_id = feed_config.get("id", "unknown")
-                        self.logger.warning(f"[RSS] feed '{feed_id}' 的 max_age_days 格式错误：{max_age_days_raw}")
-                        max_age_days = None
+            from trendradar.crawler.rss import AsyncRSSFetcher
 
-                feed = RSSFeedConfig(
-                    id=feed_config.get("id", ""),
-                    name=feed_config.get("name", ""),
-                    url=feed_config.get("url", ""),
-                    max_items=feed_config.get("max_items", 50),
-                    enabled=feed_config.get("enabled", True),
-                    max_age_days=max_age_days,  # None=使用全局，0=禁用，>0=覆盖
-                )
-                if feed.id and feed.url and feed.enabled:
-                    feeds.append(feed)
+            # RSS 源配置已在初始化时构建
+            feeds = self._rss_feed_configs
 
             if not feeds:
                 self.logger.info("[RSS] 没有启用的 RSS 源")
-                return None, None
+                return None, None, None
 
             # 创建抓取器
             rss_config = self.ctx.rss_config
@@ -649,11 +779,6 @@ class NewsAnalyzer:
             rss_proxy_url = rss_config.get("PROXY_URL", "") or self.proxy_url or ""
             # 获取配置的时区
             timezone = self.ctx.config.get("TIMEZONE", "Asia/Shanghai")
-            # 获取新鲜度过滤配置
-            freshness_config = rss_config.get("FRESHNESS_FILTER", {})
-            freshness_enabled = freshness_config.get("ENABLED", True)
-            default_max_age_days = freshness_config.get("MAX_AGE_DAYS", 3)
-
             fetcher = AsyncRSSFetcher(
                 feeds=feeds,
                 request_interval=rss_config.get("REQUEST_INTERVAL", 2000),
@@ -661,8 +786,9 @@ class NewsAnalyzer:
                 use_proxy=rss_config.get("USE_PROXY", False),
                 proxy_url=rss_proxy_url,
                 timezone=timezone,
-                freshness_enabled=freshness_enabled,
-                default_max_age_days=default_max_age_days,
+                freshness_enabled=self._freshness_enabled,
+                default_max_age_days=self._default_max_age_days,
+                client=self.ctx.http_client,
             )
 
             # 抓取数据
@@ -674,17 +800,15 @@ class NewsAnalyzer:
 
                 # 触发图片缓存 (异步)
                 try:
-                    image_urls = []
-                    for feed_items in rss_data.items.values():
-                        for item in feed_items:
-                            if item.image_url:
-                                image_urls.append(item.image_url)
-                    await self._cache_urls(image_urls)
+                    await self._cache_urls(
+                        item.image_url
+                        for feed_items in rss_data.items.values()
+                        for item in feed_items
+                        if item.image_url
+                    )
                 except Exception as e:
                     self.logger.warning(f"[RSS] 图片缓存触发失败: {e}")
 
-                # 处理 RSS 数据（按模式过滤）并返回用于合并推送
-
                 # 处理 RSS 数据（按模式过滤）并返回用于合并推送
                 return self._process_rss_data_by_mode(rss_data)
             else:
@@ -725,146 +849,119 @@ class NewsAnalyzer:
         if not rss_config.get("NOTIFICATION", {}).get("ENABLED", False):
             return None, None, None
 
-        # 加载关键词配置
-        try:
-            word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
-        except FileNotFoundError:
-            word_groups, filter_words, global_filters = [], [], []
+        # 加载关键词配置（已确认频率词文件缺失时不再重复尝试读取）
+        word_groups, filter_words, global_filters = [], [], []
+        if not self.ctx.frequency_words_missing:
+            try:
+                word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
+            except FileNotFoundError:
+                pass
 
+        config = self.ctx.config
         timezone = self.ctx.timezone
-        max_news_per_keyword = self.ctx.config.get("MAX_NEWS_PER_KEYWORD", 0)
-        sort_by_position_first = self.ctx.config.get("SORT_BY_POSITION_FIRST", False)
+        max_news_per_keyword = config.get("MAX_NEWS_PER_KEYWORD", 0)
+        sort_by_position_first = config.get("SORT_BY_POSITION_FIRST", False)
+        rank_threshold = self.rank_threshold
+        storage_manager = self.storage_manager
 
-        rss_stats = None
         rss_new_stats = None
 
         # 1. 首先获取新增条目（所有模式都需要）
-        new_items_dict = self.storage_manager.detect_new_rss_items(rss_data)
+        new_items_dict = storage_manager.detect_new_rss_items(rss_data)
         new_items_list = None
         if new_items_dict:
             new_items_list = self._convert_rss_items_to_list(new_items_dict, rss_data.id_to_name)
             if new_items_list:
-                self.logger.info(f"[RSS] 检测到 {len(new_items_list)} 条新增")
+                self.logger.info("[RSS] 检测到 %d 条新增", len(new_items_list))
 
-        # 2. 根据模式获取统计条目
-        if self.report_mode == "incremental":
-            # 增量模式：统计条目就是新增条目
-            if not new_items_list:
-                self.logger.info("[RSS] 增量模式：没有新增 RSS 条目")
-                return None, None, None
-
-            rss_stats, total = count_rss_frequency(
-                rss_items=new_items_list,
+        def _count(items: List[Dict], quiet: bool = False):
+            return count_rss_frequency(
+                rss_items=items,
                 word_groups=word_groups,
                 filter_words=filter_words,
                 global_filters=global_filters,
-                new_items=new_items_list,  # 增量模式所有都是新增
+                new_items=new_items_list,  # 标记新增
                 max_news_per_keyword=max_news_per_keyword,
                 sort_by_position_first=sort_by_position_first,
                 timezone=timezone,
-                rank_threshold=self.rank_threshold,
-                quiet=False,
+                rank_threshold=rank_threshold,
+                quiet=quiet,
             )
-            if not rss_stats:
-                self.logger.info("[RSS] 增量模式：关键词匹配后没有内容")
-                return None, None, None
-            
-            # 增量模式下，raw_items 就是 new_items_list
-            return rss_stats, None, new_items_list
 
-        elif self.report_mode == "current":
-            # 当前榜单模式：统计=当前榜单所有条目
-            latest_data = self.storage_manager.get_latest_rss_data(rss_data.date)
-            if not latest_data:
-                self.logger.info("[RSS] 当前榜单模式：没有 RSS 数据")
+        # 2. 根据模式获取统计条目
+        if self.report_mode == "incremental":
+            # 增量模式：统计条目就是新增条目
+            if not new_items_list:
+                self.logger.info("[RSS] 增量模式：没有新增 RSS 条目")
                 return None, None, None
 
-            all_items_list = self._convert_rss_items_to_list(latest_data.items, latest_data.id_to_name)
-            rss_stats, total = count_rss_frequency(
-                rss_items=all_items_list,
-                word_groups=word_groups,
-                filter_words=filter_words,
-                global_filters=global_filters,
-                new_items=new_items_list,  # 标记新增
-                max_news_per_keyword=max_news_per_keyword,
-                sort_by_position_first=sort_by_position_first,
-                timezone=timezone,
-                rank_threshold=self.rank_threshold,
-                quiet=False,
-            )
+            rss_stats, _ = _count(new_items_list)  # 增量模式所有都是新增
             if not rss_stats:
-                self.logger.info("[RSS] 当前榜单模式：关键词匹配后没有内容")
+                self.logger.info("[RSS] 增量模式：关键词匹配后没有内容")
                 return None, None, None
 
-            # 生成新增统计
-            if new_items_list:
-                rss_new_stats, _ = count_rss_frequency(
-                    rss_items=new_items_list,
-                    word_groups=word_groups,
-                    filter_words=filter_words,
-                    global_filters=global_filters,
-                    new_items=new_items_list,
-                    max_news_per_keyword=max_news_per_keyword,
-                    sort_by_position_first=sort_by_position_first,
-                    timezone=timezone,
-                    rank_threshold=self.rank_threshold,
-                    quiet=True,
-                )
+            # 增量模式下，raw_items 就是 new_items_list
+            return rss_stats, None, new_items_list
 
+        # current 模式：统计=当前榜单所有条目；daily 模式：统计=当天所有条目
+        if self.report_mode == "current":
+            mode_label = "当前榜单模式"
+            source_data = storage_manager.get_latest_rss_data(rss_data.date)
         else:
-            # daily 模式：统计=当天所有条目
-            all_data = self.storage_manager.get_rss_data(rss_data.date)
-            if not all_data:
-                self.logger.info("[RSS] 当日汇总模式：没有 RSS 数据")
-                return None, None, None
+            mode_label = "当日汇总模式"
+            source_data = storage_manager.get_rss_data(rss_data.date)
 
-            all_items_list = self._convert_rss_items_to_list(all_data.items, all_data.id_to_name)
-            rss_stats, total = count_rss_frequency(
-                rss_items=all_items_list,
-                word_groups=word_groups,
-                filter_words=filter_words,
-                global_filters=global_filters,
-                new_items=new_items_list,  # 标记新增
-                max_news_per_keyword=max_news_per_keyword,
-                sort_by_position_first=sort_by_position_first,
-                timezone=timezone,
-                rank_threshold=self.rank_threshold,
-                quiet=False,
-            )
-            if not rss_stats:
-                self.logger.info("[RSS] 当日汇总模式：关键词匹配后没有内容")
-                return None, None, None
+        if not source_data:
+            self.logger.info("[RSS] %s：没有 RSS 数据", mode_label)
+            return None, None, None
 
-            # 生成新增统计
-            if new_items_list:
-                rss_new_stats, _ = count_rss_frequency(
-                    rss_items=new_items_list,
-                    word_groups=word_groups,
-                    filter_words=filter_words,
-                    global_filters=global_filters,
-                    new_items=new_items_list,
-                    max_news_per_keyword=max_news_per_keyword,
-                    sort_by_position_first=sort_by_position_first,
-                    timezone=timezone,
-                    rank_threshold=self.rank_threshold,
-                    quiet=True,
-                )
+        all_items_list = self._convert_rss_items_to_list(source_data.items, source_data.id_to_name)
+        rss_stats, _ = _count(all_items_list)
+        if not rss_stats:
+            self.logger.info("[RSS] %s：关键词匹配后没有内容", mode_label)
+            return None, None, None
+
+        # 生成新增统计
+        if new_items_list:
+            rss_new_stats, _ = _count(new_items_list, quiet=True)
 
         return rss_stats, rss_new_stats, all_items_list
 
-    def _convert_rss_items_to_list(self, items_dict: Dict, id_to_name: Dict) -> List[Dict]:
-        """将 RSS 条目字典转换为列表格式，并应用新鲜度过滤（用于推送）"""
-        rss_items = []
-        filtered_count = 0
+    def _build_rss_feed_configs(self) -> List:
+        """构建启用的 RSS 源配置列表（配置不变，初始化时构建一次，非法值只告警一次）"""
+        from trendradar.crawler.rss import RSSFeedConfig
 
-        # 获取新鲜度过滤配置
-        rss_config = self.ctx.rss_config
-        freshness_config = rss_config.get("FRESHNESS_FILTER", {})
-        freshness_enabled = freshness_config.get("ENABLED", True)
-        default_max_age_days = freshness_config.get("MAX_AGE_DAYS", 3)
-        timezone = self.ctx.config.get("TIMEZONE", "Asia/Shanghai")
+        feeds = []
+        for feed_config in self.ctx.rss_feeds:
+            # 读取并验证单个 feed 的 max_age_days（可选）
+            max_age_days_raw = feed_config.get("max_age_days")
+            max_age_days = None
+            if max_age_days_raw is not None:
+                try:
+                    max_age_days = int(max_age_days_raw)
+                    if max_age_days < 0:
+                        feed_id = feed_config.get("id", "unknown")
+                        self.logger.warning(f"[RSS] feed '{feed_id}' 的 max_age_days 为负数，将使用全局默认值")
+                        max_age_days = None
+                except (ValueError, TypeError):
+                    feed_id = feed_config.get("id", "unknown")
+                    self.logger.warning(f"[RSS] feed '{feed_id}' 的 max_age_days 格式错误：{max_age_days_raw}")
+                    max_age_days = None
+
+            feed = RSSFeedConfig(
+                id=feed_config.get("id", ""),
+                name=feed_config.get("name", ""),
+                url=feed_config.get("url", ""),
+                max_items=feed_config.get("max_items", 50),
+                enabled=feed_config.get("enabled", True),
+                max_age_days=max_age_days,  # None=使用全局，0=禁用，>0=覆盖
+            )
+            if feed.id and feed.url and feed.enabled:
+                feeds.append(feed)
+        return feeds
 
-        # 构建 feed_id -> max_age_days 的映射
+    def _build_feed_max_age_map(self) -> Dict[str, int]:
+        """构建 feed_id -> max_age_days 的映射（RSS 配置加载后不变，只需构建一次）"""
         feed_max_age_map = {}
         for feed_cfg in self.ctx.rss_feeds:
             feed_id = feed_cfg.get("id", "")
@@ -874,29 +971,55 @@ class NewsAnalyzer:
                     feed_max_age_map[feed_id] = int(max_age)
                 except (ValueError, TypeError):
                     pass
+        return feed_max_age_map
+
+    def _convert_rss_items_to_list(self, items_dict: Dict, id_to_name: Dict) -> List[Dict]:
+        """将 RSS 条目字典转换为列表格式，并应用新鲜度过滤（用于推送）"""
+        rss_items = []
+        filtered_count = 0
+
+        # 新鲜度过滤配置（初始化时已预先解析）
+        freshness_enabled = self._freshness_enabled
+        default_max_age_days = self._default_max_age_days
+        get_max_age = self._feed_max_age_map.get
+        get_name = id_to_name.get
+        timezone = self.ctx.timezone
+        # 当前时间在整批条目中只解析一次（首次需要新鲜度过滤时）
+        now = None
 
         for feed_id, items in items_dict.items():
             # 确定此 feed 的 max_age_days
-            max_days = feed_max_age_map.get(feed_id)
+            max_days = get_max_age(feed_id)
             if max_days is None:
                 max_days = default_max_age_days
+            feed_name = get_name(feed_id, feed_id)
+
+            # 应用新鲜度过滤（仅在启用时），跳过超过指定天数的文章
+            if freshness_enabled and max_days > 0:
+                if now is None:
+                    now = get_configured_time(timezone)
+                fresh_items = [
+                    item for item in items
+                    if not item.published_at
+                    or is_within_days(item.published_at, max_days, timezone, now=now)
+                ]
+                filtered_count += len(items) - len(fresh_items)
+            else:
+                fresh_items = items
 
-            for item in items:
-                # 应用新鲜度过滤（仅在启用时）
-                if freshness_enabled and max_days > 0:
-                    if item.published_at and not is_within_days(item.published_at, max_days, timezone):
-                        filtered_count += 1
-                        continue  # 跳过超过指定天数的文章
-
-                rss_items.append({
+            # 每个 feed 一次性批量扩展，避免逐条 append
+            rss_items.extend(
+                {
                     "title": item.title,
                     "feed_id": feed_id,
-                    "feed_name": id_to_name.get(feed_id, feed_id),
+                    "feed_name": feed_name,
                     "url": item.url,
                     "published_at": item.published_at,
                     "summary": item.summary,
                     "author": item.author,
-                })
+                }
+                for item in fresh_items
+            )
 
         # 输出过滤统计
         if filtered_count > 0:
@@ -904,60 +1027,6 @@ class NewsAnalyzer:
 
         return rss_items
 
-    def _filter_rss_by_keywords(self, rss_items: List[Dict]) -> List[Dict]:
-        """使用 frequency_words.txt 过滤 RSS 条目"""
-        try:
-            word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
-            if word_groups or filter_words or global_filters:
-                from trendradar.core.frequency import matches_word_groups
-                filtered_items = []
-                for item in rss_items:
-                    title = item.get("title", "")
-                    if matches_word_groups(title, word_groups, filter_words, global_filters):
-                        filtered_items.append(item)
-
-                original_count = len(rss_items)
-                rss_items = filtered_items
-                self.logger.info(f"[RSS] 关键词过滤后剩余 {len(rss_items)}/{original_count} 条")
-
-                if not rss_items:
-                    self.logger.info("[RSS] 关键词过滤后没有匹配内容")
-                    return []
-        except FileNotFoundError:
-            # frequency_words.txt 不存在时跳过过滤
-            pass
-        return rss_items
-
-    def _generate_rss_html_report(self, rss_items: list, feeds_info: dict) -> str:
-        """生成 RSS HTML 报告"""
-        try:
-            from trendradar.report.rss_html import render_rss_html_content
-            from pathlib import Path
-
-            html_content = render_rss_html_content(
-                rss_items=rss_items,
-                total_count=len(rss_items),
-                feeds_info=feeds_info,
-                get_time_func=self.ctx.get_time,
-            )
-
-            # 保存 HTML 文件
-            date_folder = self.ctx.format_date()
-            time_filename = self.ctx.format_time()
-            output_dir = Path("output") / date_folder / "html"
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            file_path = output_dir / f"rss_{time_filename}.html"
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(html_content)
-
-            self.logger.info(f"[RSS] HTML 报告已生成: {file_path}")
-            return str(file_path)
-
-        except Exception as e:
-            self.logger.error(f"[RSS] 生成 HTML 报告失败: {e}")
-            return None
-
     async def _execute_mode_strategy(
         self, mode_strategy: Dict, results: Dict, id_to_name: Dict, failed_ids: List,
         rss_items: Optional[List[Dict]] = None,
@@ -968,11 +1037,29 @@ class NewsAnalyzer:
         # 获取当前监控平台ID列表
         current_platform_ids = self.ctx.platform_ids
 
-        new_titles = self.ctx.detect_new_titles(current_platform_ids)
+        new_titles = self._detect_new_titles(current_platform_ids)
         time_info = self.ctx.format_time()
         if self.ctx.config["STORAGE"]["FORMATS"]["TXT"]:
             self.ctx.save_titles(results, id_to_name, failed_ids)
         word_groups, filter_words, global_filters = self.ctx.load_frequency_words()
+        should_send_realtime = mode_strategy["should_send_realtime"]
+
+        async def _send_realtime(stats, new_titles_map: Dict, id_to_name_map: Dict, html_file_path) -> None:
+            """发送实时通知（合并RSS）"""
+            await self.notification_coordinator.send_notification_if_needed(
+                stats=stats,
+                report_type=mode_strategy["realtime_report_type"],
+                mode=self.report_mode,
+                failed_ids=failed_ids,
+                new_titles=new_titles_map,
+                id_to_name=id_to_name_map,
+                html_file_path=html_file_path,
+                rss_items=rss_items,
+                rss_new_items=rss_new_items,
+                rss_raw_items=rss_raw_items,
+                update_info=self.update_info,
+                proxy_url=self.proxy_url,
+            )
 
         # current模式下，实时推送需要使用完整的历史数据来保证统计信息的完整性
         if self.report_mode == "current":
@@ -1007,31 +1094,23 @@ class NewsAnalyzer:
                     rss_new_items=rss_new_items,
                 )
 
-                combined_id_to_name = {**historical_id_to_name, **id_to_name}
+                # 只需查找语义，ChainMap 按顺序查找，本次抓取的名称优先，无需复制历史映射
+                combined_id_to_name = ChainMap(id_to_name, historical_id_to_name)
 
                 if html_file:
                     self.logger.info(f"HTML报告已生成: {html_file}")
 
                 # 发送实时通知（使用完整历史数据的统计结果，合并RSS）
-                summary_html = None
-                if mode_strategy["should_send_realtime"]:
-                    await self.notification_coordinator.send_notification_if_needed(
-                        stats=stats,
-                        report_type=mode_strategy["realtime_report_type"],
-                        mode=self.report_mode,
-                        failed_ids=failed_ids,
-                        new_titles=historical_new_titles,
-                        id_to_name=combined_id_to_name,
-                        html_file_path=html_file,
-                        rss_items=rss_items,
-                        rss_new_items=rss_new_items,
-                        rss_raw_items=rss_raw_items,
-                        update_info=self.update_info,
-                        proxy_url=self.proxy_url,
-                    )
+                if should_send_realtime:
+                    await _send_realtime(stats, historical_new_titles, combined_id_to_name, html_file)
             else:
                 self.logger.error("数据一致性检查失败：保存后立即读取失败")
                 raise RuntimeError("数据一致性检查失败：保存后立即读取失败")
+        elif not results and not (rss_items or rss_new_items):
+            # 本次抓取没有任何热榜与 RSS 数据（如全部失败或被限流），跳过实时分析与推送；
+            # 汇总报告基于当天历史数据，仍照常生成
+            self.logger.info("本次抓取没有新数据，跳过实时分析流水线")
+            html_file = None
         else:
             title_info = self._prepare_current_title_info(results, time_info)
             stats, html_file = await self._run_analysis_pipeline(
@@ -1051,27 +1130,13 @@ class NewsAnalyzer:
                 self.logger.info(f"HTML报告已生成: {html_file}")
 
             # 发送实时通知（如果需要，合并RSS）
-            summary_html = None
-            if mode_strategy["should_send_realtime"]:
-                await self.notification_coordinator.send_notification_if_needed(
-                    stats=stats,
-                    report_type=mode_strategy["realtime_report_type"],
-                    mode=self.report_mode,
-                    failed_ids=failed_ids,
-                    new_titles=new_titles,
-                    id_to_name=id_to_name,
-                    html_file_path=html_file,
-                    rss_items=rss_items,
-                    rss_new_items=rss_new_items,
-                    rss_raw_items=rss_raw_items,
-                    update_info=self.update_info,
-                    proxy_url=self.proxy_url,
-                )
+            if should_send_realtime:
+                await _send_realtime(stats, new_titles, id_to_name, html_file)
 
         # 生成汇总报告（如果需要）
         summary_html = None
         if mode_strategy["should_generate_summary"]:
-            if mode_strategy["should_send_realtime"]:
+            if should_send_realtime:
                 # 如果已经发送了实时通知，汇总只生成HTML不发送通知
                 summary_html = await self._generate_summary_html(
                     mode_strategy["summary_mode"],
@@ -1089,16 +1154,13 @@ class NewsAnalyzer:
                 )
 
         # 打开浏览器（仅在非容器环境）
-        if self._should_open_browser() and html_file:
+        if self._should_open_browser() and (html_file or summary_html):
+            # 路径解析与浏览器启动都是阻塞操作，放到线程中执行，避免阻塞事件循环
             if summary_html:
-                summary_url = "file://" + str(Path(summary_html).resolve())
-                self.logger.info(f"正在打开汇总报告: {summary_url}")
-                webbrowser.open(summary_url)
+                await asyncio.to_thread(self._open_in_browser, summary_html, "汇总报告")
             else:
-                file_url = "file://" + str(Path(html_file).resolve())
-                self.logger.info(f"正在打开HTML报告: {file_url}")
-                webbrowser.open(file_url)
-        elif self.is_docker_container and html_file:
+                await asyncio.to_thread(self._open_in_browser, html_file, "HTML报告")
+        elif self.is_docker_container and (html_file or summary_html):
             if summary_html:
                 self.logger.info(f"汇总报告已生成（Docker环境）: {summary_html}")
             else:
@@ -1108,6 +1170,9 @@ class NewsAnalyzer:
 
     async def run(self) -> None:
         """执行分析流程 (异步)"""
+        # 版本检查在后台进行，与抓取流程重叠，推送前再等待结果
+        # 本地/Docker 运行时远程版本号缓存 24 小时，多数运行不发起网络请求
+        version_task = asyncio.create_task(self._check_version_update())
         try:
             self._initialize_and_check_config()
 
@@ -1118,11 +1183,20 @@ class NewsAnalyzer:
 
             mode_strategy = self._get_mode_strategy()
 
-            # 抓取热榜数据 (异步)
-            results, id_to_name, failed_ids = await self._crawl_data()
+            # 热榜与 RSS 抓取互不依赖，并发执行以重叠网络等待
+            crawl_result, rss_result = await asyncio.gather(
+                self._crawl_data(), self._crawl_rss_data(), return_exceptions=True
+            )
+            if isinstance(rss_result, BaseException):
+                # RSS 失败不影响热榜流程
+                self.logger.error(f"[RSS] 抓取流程出错: {rss_result}")
+                rss_result = (None, None, None)
+            if isinstance(crawl_result, BaseException):
+                raise crawl_result
+            results, id_to_name, failed_ids = crawl_result
+            rss_stats, rss_new_stats, rss_raw = rss_result
 
-            # 抓取 RSS 数据 (异步/同步混合)
-            rss_stats, rss_new_stats, rss_raw = await self._crawl_rss_data()
+            await version_task
 
             # 执行模式策略，传递 RSS 数据用于合并推送
             await self._execute_mode_strategy(
@@ -1135,6 +1209,8 @@ class NewsAnalyzer:
             self.logger.error(f"分析流程执行出错: {e}", exc_info=True)
             raise
         finally:
+            if not version_task.done():
+                version_task.cancel()
             # 清理资源（包括过期数据清理和数据库连接关闭）
             self.ctx.cleanup()
             await self.ctx.aclose()
@@ -5,23 +5,31 @@
 提供配置上下文类，封装所有依赖配置的操作，消除全局状态和包装函数。
 """
 
+import asyncio
+from collections import defaultdict
 from datetime import datetime
+from functools import cached_property, lru_cache
 import hashlib
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 import httpx
 
+try:
+    import h2  # noqa: F401  可选依赖：启用 HTTP/2 多路复用
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 from trendradar.utils.time import (
     get_configured_time,
-    format_date_folder,
-    format_time_filename,
     get_current_time_display,
     convert_time_for_display,
 )
 from trendradar.core import (
     load_frequency_words,
+    clear_frequency_words_cache,
     matches_word_groups,
     save_titles_to_file,
     read_all_today_titles,
@@ -42,9 +50,103 @@ from trendradar.notification import (
     PushRecordManager,
 )
 from trendradar.storage import get_storage_manager
+from trendradar.core.constants import CONCURRENCY, TIMEOUT
 
 logger = logging.getLogger(__name__)
 
+# 进程级共享 HTTP 客户端（多个 AppContext 复用同一连接池，按引用计数关闭）
+_shared_http_client: Optional[httpx.AsyncClient] = None
+_shared_http_client_refs = 0
+
+
+def create_http_client(proxy: Optional[str] = None) -> httpx.AsyncClient:
+    """
+    按项目统一设置创建 HTTP 客户端（连接池限制、分阶段超时、按需启用 HTTP/2、跟随重定向）
+
+    Args:
+        proxy: 代理地址（可选）
+
+    Returns:
+        新建的 httpx.AsyncClient，由调用方负责关闭
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_keepalive_connections=CONCURRENCY.HTTP_MAX_KEEPALIVE,
+            max_connections=CONCURRENCY.HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=CONCURRENCY.HTTP_KEEPALIVE_EXPIRY,
+        ),
+        # 分阶段超时：握手/取连接过慢时尽早失败，不占满整个读取预算
+        timeout=httpx.Timeout(
+            connect=TIMEOUT.HTTP_CONNECT_TIMEOUT,
+            read=float(TIMEOUT.HTTP_REQUEST_TIMEOUT),
+            write=TIMEOUT.HTTP_WRITE_TIMEOUT,
+            pool=TIMEOUT.HTTP_POOL_TIMEOUT,
+        ),
+        http2=_HTTP2_AVAILABLE,
+        follow_redirects=True,
+        proxy=proxy or None,
+        headers={
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        }
+    )
+
+
+def _acquire_shared_http_client() -> httpx.AsyncClient:
+    """获取进程级共享 HTTP 客户端，不存在或已关闭时新建，并增加引用计数"""
+    global _shared_http_client, _shared_http_client_refs
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = create_http_client()
+        _shared_http_client_refs = 0
+    _shared_http_client_refs += 1
+    return _shared_http_client
+
+
+async def _release_shared_http_client(client: httpx.AsyncClient) -> None:
+    """释放共享 HTTP 客户端引用，最后一个使用者负责关闭连接池"""
+    global _shared_http_client, _shared_http_client_refs
+    if client is not _shared_http_client:
+        # 已被替换的旧客户端（例如此前已关闭后重建），直接关闭
+        if not client.is_closed:
+            await _close_http_client(client)
+        return
+    _shared_http_client_refs -= 1
+    if _shared_http_client_refs <= 0:
+        _shared_http_client = None
+        _shared_http_client_refs = 0
+        await _close_http_client(client)
+
+
+async def _close_http_client(client: httpx.AsyncClient) -> None:
+    """
+    关闭 HTTP 客户端，限时且不受外层取消影响
+
+    卡住的连接最多阻塞 HTTP_CLOSE_TIMEOUT 秒；外层被取消时关闭操作在后台继续完成。
+    """
+    try:
+        await asyncio.wait_for(
+            asyncio.shield(client.aclose()), timeout=TIMEOUT.HTTP_CLOSE_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        logger.warning(f"[HTTP] 关闭客户端超时（{TIMEOUT.HTTP_CLOSE_TIMEOUT}s），跳过等待")
+    except asyncio.CancelledError:
+        logger.warning("[HTTP] 关闭客户端时任务被取消，连接池在后台继续关闭")
+        raise
+
+
+class _HashInfo(NamedTuple):
+    """去重条目信息（按 hash 索引，替代逐条构建的字典）"""
+    title: str
+    url: str
+    source_id: str
+    obj: Any  # 原始条目：热榜 title_obj / 新增列表 title_info / RSS item
+    stat: Optional[Dict] = None  # 热榜条目所属的 stat
+
+
+@lru_cache(maxsize=8192)
+def _md5_hexdigest(text: str) -> str:
+    """计算文本的 MD5 指纹（仅用于去重，结果缓存，重复 URL 直接命中）"""
+    return hashlib.md5(text.encode("utf-8"), usedforsecurity=False).hexdigest()
+
 
 class AppContext:
     """
@@ -62,7 +164,7 @@ class AppContext:
         date_folder = ctx.format_date()
 
         # 存储操作
-        storage = ctx.get_storage_manager()
+        storage = ctx.storage_manager
 
         # 报告生成
         html = ctx.generate_html_report(stats, total_titles, ...)
@@ -76,41 +178,63 @@ class AppContext:
             config: 完整的配置字典
         """
         self.config = config
-        self._storage_manager = None
-        self._llm_service = None
+        # 本次运行的基准时间（首次格式化日期/时间时确定，cleanup 时重置）
+        self._run_time: Optional[datetime] = None
+        # 基准时间对应的 (日期目录, 时间文件名) 字符串，首次格式化后缓存
+        self._run_stamp: Optional[Tuple[str, str]] = None
+        # 默认频率词文件是否缺失（首次加载失败后记录，避免重复查找与抛出异常）
+        self._freq_words_missing = False
+        # 高频读取的静态配置项，初始化时解析一次
+        self._timezone = config.get("TIMEZONE", "Asia/Shanghai")
+        self._rank_threshold = config.get("RANK_THRESHOLD", 50)
+        self._weight_config = config.get("WEIGHT_CONFIG", {})
+        self._max_news_per_keyword = config.get("MAX_NEWS_PER_KEYWORD", 0)
+        self._sort_by_position_first = config.get("SORT_BY_POSITION_FIRST", False)
+        self._display_mode = config.get("DISPLAY_MODE", "keyword")
+        self._report_title = config.get("REPORT_TITLE", "热点新闻分析")
+        self._reverse_content_order = config.get("REVERSE_CONTENT_ORDER", False)
+        self._feishu_separator = config.get("FEISHU_MESSAGE_SEPARATOR", "---")
+        self._batch_sizes = {
+            "dingtalk": config.get("DINGTALK_BATCH_SIZE", 20000),
+            "feishu": config.get("FEISHU_BATCH_SIZE", 29000),
+            "default": config.get("MESSAGE_BATCH_SIZE", 4000),
+        }
+        self._max_notify_news = config.get("MAX_NOTIFY_NEWS", 5)
+        self._web_url = config.get("WEB_URL", "")
+        # 图片展示链接的服务地址（优先 app.web_url）
+        self._image_web_url = config.get("app", {}).get("web_url") or config.get("WEB_URL")
+        self._dedup_config = config.get("NOTIFICATION", {}).get("deduplication", {})
+        # 去重哈希策略
+        self._use_url_hash = self._dedup_config.get("use_url_hash", True)
+        # 监控平台 ID（配置构建后不再变化，初始化时计算一次）
+        self._platform_ids: Tuple[str, ...] = tuple(p["id"] for p in config.get("PLATFORMS", []))
+        self._platform_id_set = frozenset(self._platform_ids)
         
-        # 全局 HTTP 客户端，用于连接池复用
-        # 限制并发连接数，防止耗尽资源
-        self.http_client = httpx.AsyncClient(
-            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
-            timeout=30.0,
-            follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            }
-        )
+        # 进程级共享 HTTP 客户端，用于连接池复用
+        self.http_client: Optional[httpx.AsyncClient] = _acquire_shared_http_client()
 
     async def aclose(self):
-        """异步关闭资源"""
+        """异步关闭资源（释放共享 HTTP 客户端引用）"""
         if self.http_client:
-            await self.http_client.aclose()
+            client, self.http_client = self.http_client, None
+            await _release_shared_http_client(client)
 
     # === 配置访问 ===
 
     @property
     def timezone(self) -> str:
         """获取配置的时区"""
-        return self.config.get("TIMEZONE", "Asia/Shanghai")
+        return self._timezone
 
     @property
     def rank_threshold(self) -> int:
         """获取排名阈值"""
-        return self.config.get("RANK_THRESHOLD", 50)
+        return self._rank_threshold
 
     @property
     def weight_config(self) -> Dict:
         """获取权重配置"""
-        return self.config.get("WEIGHT_CONFIG", {})
+        return self._weight_config
 
     @property
     def platforms(self) -> List[Dict]:
@@ -118,9 +242,14 @@ class AppContext:
         return self.config.get("PLATFORMS", [])
 
     @property
-    def platform_ids(self) -> List[str]:
-        """获取平台ID列表"""
-        return [p["id"] for p in self.platforms]
+    def platform_ids(self) -> Tuple[str, ...]:
+        """获取平台ID列表（按配置顺序）"""
+        return self._platform_ids
+
+    @property
+    def platform_id_set(self) -> frozenset:
+        """获取平台ID集合（用于 O(1) 成员判断）"""
+        return self._platform_id_set
 
     @property
     def rss_config(self) -> Dict:
@@ -140,7 +269,7 @@ class AppContext:
     @property
     def display_mode(self) -> str:
         """获取显示模式 (keyword | platform)"""
-        return self.config.get("DISPLAY_MODE", "keyword")
+        return self._display_mode
 
     # === 时间操作 ===
 
@@ -148,13 +277,26 @@ class AppContext:
         """获取当前配置时区的时间"""
         return get_configured_time(self.timezone)
 
+    def _get_run_time(self) -> datetime:
+        """获取本次运行的基准时间，同一次运行内的日期目录与时间文件名保持一致"""
+        if self._run_time is None:
+            self._run_time = self.get_time()
+        return self._run_time
+
+    def _get_run_stamp(self) -> Tuple[str, str]:
+        """获取基准时间的 (YYYY-MM-DD, HH-MM) 字符串，同一次运行内只格式化一次"""
+        if self._run_stamp is None:
+            run_time = self._get_run_time()
+            self._run_stamp = (run_time.strftime("%Y-%m-%d"), run_time.strftime("%H-%M"))
+        return self._run_stamp
+
     def format_date(self) -> str:
         """格式化日期文件夹 (YYYY-MM-DD)"""
-        return format_date_folder(timezone=self.timezone)
+        return self._get_run_stamp()[0]
 
     def format_time(self) -> str:
         """格式化时间文件名 (HH-MM)"""
-        return format_time_filename(self.timezone)
+        return self._get_run_stamp()[1]
 
     def get_time_display(self) -> str:
         """获取时间显示 (HH:MM)"""
@@ -167,34 +309,37 @@ class AppContext:
 
     # === 存储操作 ===
 
+    @cached_property
+    def storage_manager(self):
+        """存储管理器（延迟初始化，首次访问后缓存为实例属性）"""
+        storage_config = self.config.get("STORAGE", {})
+        remote_config = storage_config.get("REMOTE", {})
+        local_config = storage_config.get("LOCAL", {})
+        pull_config = storage_config.get("PULL", {})
+
+        return get_storage_manager(
+            backend_type=storage_config.get("BACKEND", "auto"),
+            data_dir=local_config.get("DATA_DIR", "output"),
+            enable_txt=storage_config.get("FORMATS", {}).get("TXT", True),
+            enable_html=storage_config.get("FORMATS", {}).get("HTML", True),
+            remote_config={
+                "bucket_name": remote_config.get("BUCKET_NAME", ""),
+                "access_key_id": remote_config.get("ACCESS_KEY_ID", ""),
+                "secret_access_key": remote_config.get("SECRET_ACCESS_KEY", ""),
+                "endpoint_url": remote_config.get("ENDPOINT_URL", ""),
+                "region": remote_config.get("REGION", ""),
+            },
+            local_retention_days=local_config.get("RETENTION_DAYS", 0),
+            remote_retention_days=remote_config.get("RETENTION_DAYS", 0),
+            pull_enabled=pull_config.get("ENABLED", False),
+            pull_days=pull_config.get("DAYS", 7),
+            timezone=self.timezone,
+            http_client=self.http_client,
+        )
+
     def get_storage_manager(self):
-        """获取存储管理器（延迟初始化，单例）"""
-        if self._storage_manager is None:
-            storage_config = self.config.get("STORAGE", {})
-            remote_config = storage_config.get("REMOTE", {})
-            local_config = storage_config.get("LOCAL", {})
-            pull_config = storage_config.get("PULL", {})
-
-            self._storage_manager = get_storage_manager(
-                backend_type=storage_config.get("BACKEND", "auto"),
-                data_dir=local_config.get("DATA_DIR", "output"),
-                enable_txt=storage_config.get("FORMATS", {}).get("TXT", True),
-                enable_html=storage_config.get("FORMATS", {}).get("HTML", True),
-                remote_config={
-                    "bucket_name": remote_config.get("BUCKET_NAME", ""),
-                    "access_key_id": remote_config.get("ACCESS_KEY_ID", ""),
-                    "secret_access_key": remote_config.get("SECRET_ACCESS_KEY", ""),
-                    "endpoint_url": remote_config.get("ENDPOINT_URL", ""),
-                    "region": remote_config.get("REGION", ""),
-                },
-                local_retention_days=local_config.get("RETENTION_DAYS", 0),
-                remote_retention_days=remote_config.get("RETENTION_DAYS", 0),
-                pull_enabled=pull_config.get("ENABLED", False),
-                pull_days=pull_config.get("DAYS", 7),
-                timezone=self.timezone,
-                http_client=self.http_client,
-            )
-        return self._storage_manager
+        """获取存储管理器（兼容旧接口，等价于 storage_manager 属性）"""
+        return self.storage_manager
 
     def get_output_path(self, subfolder: str, filename: str) -> str:
         """获取输出路径"""
@@ -204,12 +349,15 @@ class AppContext:
 
     # === LLM 服务 ===
 
+    @cached_property
+    def llm_service(self):
+        """LLM 服务实例（延迟导入，首次访问后缓存为实例属性）"""
+        from trendradar.core.llm_service import LLMService
+        return LLMService(self.config)
+
     def get_llm_service(self):
-        """获取 LLM 服务实例（延迟导入）"""
-        if self._llm_service is None:
-            from trendradar.core.llm_service import LLMService
-            self._llm_service = LLMService(self.config)
-        return self._llm_service
+        """获取 LLM 服务实例（兼容旧接口，等价于 llm_service 属性）"""
+        return self.llm_service
 
     # === 数据处理 ===
 
@@ -218,21 +366,31 @@ class AppContext:
         output_path = self.get_output_path("txt", f"{self.format_time()}.txt")
         return save_titles_to_file(results, id_to_name, failed_ids, output_path, clean_title)
 
+    def _platform_filter(self, platform_ids: Optional[Sequence[str]]):
+        """平台过滤条件仅用于成员判断，传入的是配置平台列表时改用预计算的集合"""
+        if platform_ids is self._platform_ids:
+            return self._platform_id_set
+        return platform_ids
+
     def read_today_titles(
-        self, platform_ids: Optional[List[str]] = None, quiet: bool = False
+        self, platform_ids: Optional[Sequence[str]] = None, quiet: bool = False
     ) -> Tuple[Dict, Dict, Dict]:
         """读取当天所有标题"""
-        return read_all_today_titles(self.get_storage_manager(), platform_ids, quiet=quiet)
+        return read_all_today_titles(
+            self.storage_manager, self._platform_filter(platform_ids), quiet=quiet
+        )
 
     def detect_new_titles(
-        self, platform_ids: Optional[List[str]] = None, quiet: bool = False
+        self, platform_ids: Optional[Sequence[str]] = None, quiet: bool = False
     ) -> Dict:
         """检测最新批次的新增标题"""
-        return detect_latest_new_titles(self.get_storage_manager(), platform_ids, quiet=quiet)
+        return detect_latest_new_titles(
+            self.storage_manager, self._platform_filter(platform_ids), quiet=quiet
+        )
 
     def is_first_crawl(self) -> bool:
         """检测是否是当天第一次爬取"""
-        return self.get_storage_manager().is_first_crawl_today()
+        return self.storage_manager.is_first_crawl_today()
 
     # === 频率词处理 ===
 
@@ -240,7 +398,17 @@ class AppContext:
         self, frequency_file: Optional[str] = None
     ) -> Tuple[List[Dict], List[str], List[str]]:
         """加载频率词配置"""
-        return load_frequency_words(frequency_file)
+        try:
+            return load_frequency_words(frequency_file)
+        except FileNotFoundError:
+            if frequency_file is None:
+                self._freq_words_missing = True
+            raise
+
+    @property
+    def frequency_words_missing(self) -> bool:
+        """默认频率词文件是否已确认缺失"""
+        return self._freq_words_missing
 
     def matches_word_groups(
         self,
@@ -278,8 +446,8 @@ class AppContext:
             mode=mode,
             global_filters=global_filters,
             weight_config=self.weight_config,
-            max_news_per_keyword=self.config.get("MAX_NEWS_PER_KEYWORD", 0),
-            sort_by_position_first=self.config.get("SORT_BY_POSITION_FIRST", False),
+            max_news_per_keyword=self._max_news_per_keyword,
+            sort_by_position_first=self._sort_by_position_first,
             is_first_crawl_func=self.is_first_crawl,
             convert_time_func=self.convert_time_display,
             quiet=quiet,
@@ -306,7 +474,7 @@ class AppContext:
             matches_word_groups_func=self.matches_word_groups,
             load_frequency_words_func=self.load_frequency_words,
         )
-        data["report_title"] = self.config.get("REPORT_TITLE", "热点新闻分析")
+        data["report_title"] = self._report_title
         
         # 尝试丰富图片链接 (将原始链接转换为本地缓存的 Web 链接)
         self.enrich_with_display_images(data)
@@ -363,12 +531,12 @@ class AppContext:
             is_daily_summary=is_daily_summary,
             mode=mode,
             update_info=update_info,
-            reverse_content_order=self.config.get("REVERSE_CONTENT_ORDER", False),
+            reverse_content_order=self._reverse_content_order,
             get_time_func=self.get_time,
             rss_items=rss_items,
             rss_new_items=rss_new_items,
             display_mode=self.display_mode,
-            report_title=self.config.get("REPORT_TITLE", "热点新闻分析"),
+            report_title=self._report_title,
         )
 
     def enrich_with_display_images(self, report_data: Dict) -> None:
@@ -376,15 +544,38 @@ class AppContext:
         丰富图片链接：检查是否存在本地缓存图片，如果有则生成 Web 访问链接覆盖 image_url
         并将原始链接保存在 original_image_url
         """
-        web_url = self.config.get("app", {}).get("web_url") or self.config.get("WEB_URL")
+        web_url = self._image_web_url
         if not web_url:
             return
 
+        # 报告中没有任何图片链接时（纯 RSS 或无缩略图的源）直接跳过，不触发图片缓存初始化与目录扫描
+        new_titles = report_data.get("new_titles")
+        has_images = any(
+            isinstance(t, dict) and t.get("image_url")
+            for stat in report_data.get("stats", [])
+            for t in stat["titles"]
+        ) or (
+            isinstance(new_titles, dict)
+            and any(
+                isinstance(info, dict) and info.get("image_url")
+                for titles_data in new_titles.values()
+                if isinstance(titles_data, dict)
+                for info in titles_data.values()
+            )
+        )
+        if not has_images:
+            return
+
         # 确保 web_url 不包含结尾斜杠，并且 /images 路径正确映射
         # 假设 web_url 是 http://server:port，图片路由是 /images
         # ImageCache.get_cached_url 会处理 base_url 拼接
         
-        image_base_url = f"{web_url.rstrip('/')}/images"
+        image_base_prefix = f"{web_url.rstrip('/')}/images/"
+
+        cache = self.storage_manager.image_cache
+        # 缓存目录只扫描一次，热榜与新增列表共用同一索引
+        existing_index = cache.build_existing_index() if cache else None
+        base_dir = cache.base_dir if cache else None
         
         # 1. 处理 stats
         if "stats" in report_data:
@@ -403,17 +594,15 @@ class AppContext:
                             # 这里存在一个问题：get_cached_url 是 async 的，而 prepare_report 是 sync 的
                             # 我们需要一个同步的 "get_existing_cache_url" 方法
                             
-                            cache = self.get_storage_manager().image_cache
                             if cache:
-                                cached_path = cache.find_existing_cache(img_url)
+                                cached_path = cache.find_existing_cache(img_url, existing_index)
                                 if cached_path:
                                     # 转换为 web url
                                     # output/cache/images/yyyy-mm-dd/hash.jpg -> /images/yyyy-mm-dd/hash.jpg
                                     try:
-                                        rel_path = cached_path.relative_to(cache.base_dir)
-                                        # 统一正斜杠
-                                        rel_path_str = str(rel_path).replace("\\", "/")
-                                        display_url = f"{image_base_url}/{rel_path_str}"
+                                        # as_posix 统一正斜杠
+                                        rel_path_str = cached_path.relative_to(base_dir).as_posix()
+                                        display_url = image_base_prefix + rel_path_str
                                         
                                         title_obj["original_image_url"] = img_url
                                         title_obj["display_image_url"] = display_url
@@ -422,7 +611,6 @@ class AppContext:
                                         
         # 2. 处理 new_titles (新增列表)
         if "new_titles" in report_data and isinstance(report_data["new_titles"], dict):
-            cache = self.get_storage_manager().image_cache
             if cache:
                 for source_id, titles_data in report_data["new_titles"].items():
                     if not isinstance(titles_data, dict):
@@ -432,13 +620,12 @@ class AppContext:
                             continue
                         img_url = info.get("image_url")
                         if img_url:
-                            cached_path = cache.find_existing_cache(img_url)
+                            cached_path = cache.find_existing_cache(img_url, existing_index)
                             if cached_path:
                                 try:
-                                    rel_path = cached_path.relative_to(cache.base_dir)
-                                    rel_path_str = str(rel_path).replace("\\", "/")
+                                    rel_path_str = cached_path.relative_to(base_dir).as_posix()
                                     info["original_image_url"] = img_url
-                                    info["display_image_url"] = f"{image_base_url}/{rel_path_str}"
+                                    info["display_image_url"] = image_base_prefix + rel_path_str
                                 except ValueError:
                                     pass
 
@@ -455,8 +642,8 @@ class AppContext:
             report_data=report_data,
             update_info=update_info,
             mode=mode,
-            separator=self.config.get("FEISHU_MESSAGE_SEPARATOR", "---"),
-            reverse_content_order=self.config.get("REVERSE_CONTENT_ORDER", False),
+            separator=self._feishu_separator,
+            reverse_content_order=self._reverse_content_order,
             get_time_func=self.get_time,
         )
 
@@ -471,7 +658,7 @@ class AppContext:
             report_data=report_data,
             update_info=update_info,
             mode=mode,
-            reverse_content_order=self.config.get("REVERSE_CONTENT_ORDER", False),
+            reverse_content_order=self._reverse_content_order,
             get_time_func=self.get_time,
         )
 
@@ -505,20 +692,16 @@ class AppContext:
             update_info=update_info,
             max_bytes=max_bytes,
             mode=mode,
-            batch_sizes={
-                "dingtalk": self.config.get("DINGTALK_BATCH_SIZE", 20000),
-                "feishu": self.config.get("FEISHU_BATCH_SIZE", 29000),
-                "default": self.config.get("MESSAGE_BATCH_SIZE", 4000),
-            },
-            feishu_separator=self.config.get("FEISHU_MESSAGE_SEPARATOR", "---"),
-            reverse_content_order=self.config.get("REVERSE_CONTENT_ORDER", False),
+            batch_sizes=self._batch_sizes,
+            feishu_separator=self._feishu_separator,
+            reverse_content_order=self._reverse_content_order,
             get_time_func=self.get_time,
             rss_items=rss_items,
             rss_new_items=rss_new_items,
-            timezone=self.config.get("TIMEZONE", "Asia/Shanghai"),
+            timezone=self._timezone,
             display_mode=self.display_mode,
-            max_notify_news=self.config.get("MAX_NOTIFY_NEWS", 5),
-            web_url=self.config.get("WEB_URL", ""),
+            max_notify_news=self._max_notify_news,
+            web_url=self._web_url,
         )
 
     # === 通知发送 ===
@@ -534,7 +717,7 @@ class AppContext:
     def create_push_manager(self) -> PushRecordManager:
         """创建推送记录管理器"""
         return PushRecordManager(
-            storage_backend=self.get_storage_manager(),
+            storage_backend=self.storage_manager,
             get_time_func=self.get_time,
         )
 
@@ -542,16 +725,11 @@ class AppContext:
 
     def get_content_hash(self, item_url: str, item_title: str, item_source: str) -> str:
         """计算内容哈希值"""
-        dedup_config = self.config.get("NOTIFICATION", {}).get("deduplication", {})
-        use_url_hash = dedup_config.get("use_url_hash", True)
-
-        if use_url_hash and item_url:
+        if self._use_url_hash and item_url:
             # 使用 URL 哈希
-            return hashlib.md5(item_url.encode("utf-8")).hexdigest()
-        else:
-            # 使用 标题+来源 哈希
-            content = f"{item_source}:{item_title}"
-            return hashlib.md5(content.encode("utf-8")).hexdigest()
+            return _md5_hexdigest(item_url)
+        # 使用 标题+来源 哈希
+        return _md5_hexdigest(f"{item_source}:{item_title}")
 
     def deduplicate_report_data(
         self, report_data: Dict
@@ -559,7 +737,7 @@ class AppContext:
         """
         对报告数据进行去重处理
 
-        优化：使用批量查询接口一次性查询所有 hash，减少数据库往返次数
+        优化：热榜与新增列表的 hash 合并为一次批量查询，减少数据库往返次数
 
         Args:
             report_data: 原始报告数据
@@ -569,73 +747,91 @@ class AppContext:
             - filtered_report_data: 去重后的报告数据（可直接用于发送）
             - items_to_record: 需要记录到已推送表的数据列表
         """
-        dedup_config = self.config.get("NOTIFICATION", {}).get("deduplication", {})
+        dedup_config = self._dedup_config
         if not dedup_config.get("enabled", False):
             return report_data, []
 
         items_to_record = []
-        filtered_stats = []
-
-        # 第一步：收集所有需要查询的 hash（热榜数据）
-        hash_to_info = {}  # {hash: {title, url, source_id, title_obj}}
+        record_append = items_to_record.append
+        filtered_by_stat_id: Dict[int, Dict] = {}
+        hash_fn = self.get_content_hash
+        dedup_new_titles = dedup_config.get("dedup_new_titles", True) and "new_titles" in report_data
+        new_titles = report_data.get("new_titles") if dedup_new_titles else None
+
+        # 第一步：收集所有需要查询的 hash（热榜数据 + 新增列表），合并为一次批量查询
+        hash_to_info: Dict[str, _HashInfo] = {}
         
         if "stats" in report_data:
             for stat in report_data["stats"]:
                 for title_obj in stat["titles"]:
                     # title_obj 可能是 NewsItem 对象或字典，需兼容处理
-                    if hasattr(title_obj, "url"):
-                        url = title_obj.url
-                        title = title_obj.title
-                        source_id = title_obj.source_id
-                    else:
+                    # （字典为常见情况，用类型判断代替 hasattr 的异常探测）
+                    if isinstance(title_obj, dict):
                         url = title_obj.get("url", "")
                         title = title_obj.get("title", "")
                         source_id = title_obj.get("source_id", "")
+                    else:
+                        url = title_obj.url
+                        title = title_obj.title
+                        source_id = title_obj.source_id
+
+                    content_hash = hash_fn(url, title, source_id)
+                    hash_to_info[content_hash] = _HashInfo(title, url, source_id, title_obj, stat)
+
+        # 列表结构（来自 prepare_report_data）：扁平化为 (来源下标, title_data, hash, title, url)
+        new_title_entries: List[Tuple[int, Dict, str, str, str]] = []
+        # 旧版字典结构：{hash: _HashInfo}
+        new_titles_hash_to_info: Dict[str, _HashInfo] = {}
+
+        if isinstance(new_titles, list):
+            entry_append = new_title_entries.append
+            for source_idx, source_item in enumerate(new_titles):
+                source_id = source_item.get("source_id", "")
+                for title_data in source_item.get("titles", []):
+                    title = title_data.get("title", "")
+                    url = title_data.get("url", "")
+                    entry_append((source_idx, title_data, hash_fn(url, title, source_id), title, url))
+        elif isinstance(new_titles, dict):
+            for source_id, titles_dict in new_titles.items():
+                for title_text, title_info in titles_dict.items():
+                    url = title_info.get("url", "")
+                    content_hash = hash_fn(url, title_text, source_id)
+                    new_titles_hash_to_info[content_hash] = _HashInfo(title_text, url, source_id, title_info)
+
+        # 第二步：一次批量查询所有 hash 是否已推送
+        all_hashes = set(hash_to_info)
+        all_hashes.update(new_titles_hash_to_info)
+        all_hashes.update(entry[2] for entry in new_title_entries)
 
-                    content_hash = self.get_content_hash(url, title, source_id)
-                    hash_to_info[content_hash] = {
-                        "title": title,
-                        "url": url,
-                        "source_id": source_id,
-                        "title_obj": title_obj,
-                        "stat": stat
-                    }
-        
-        # 第二步：批量查询所有 hash 是否已推送
         pushed_hashes = set()
-        if hash_to_info:
-            batch_result = self.get_storage_manager().is_news_pushed_batch(list(hash_to_info.keys()))
-            pushed_hashes = {h for h, is_pushed in batch_result.items() if is_pushed}
+        if all_hashes:
+            pushed_hashes = self.storage_manager.get_pushed_hashes(list(all_hashes))
         
         # 第三步：过滤未推送的新闻
         for content_hash, info in hash_to_info.items():
             if content_hash not in pushed_hashes:
                 # 未推送，添加到结果
-                title_obj = info["title_obj"]
+                title_obj = info.obj
                 
-                # 找到对应的 stat 并添加标题
-                stat = info["stat"]
-                if stat not in filtered_stats:
-                    new_stat = stat.copy()
-                    new_stat["titles"] = []
-                    new_stat["count"] = 0
-                    filtered_stats.append(new_stat)
-                
-                # 找到对应的 filtered_stat
-                for filtered_stat in filtered_stats:
-                    if filtered_stat["word"] == stat["word"]:
-                        filtered_stat["titles"].append(title_obj)
-                        filtered_stat["count"] += 1
-                        break
+                # 按原 stat 对象归组，首次命中时创建空副本（保持原 stats 顺序）
+                stat = info.stat
+                filtered_stat = filtered_by_stat_id.get(id(stat))
+                if filtered_stat is None:
+                    filtered_stat = {**stat, "titles": [], "count": 0}
+                    filtered_by_stat_id[id(stat)] = filtered_stat
+                filtered_stat["titles"].append(title_obj)
+                filtered_stat["count"] += 1
                 
                 # 添加到记录列表
-                items_to_record.append({
+                record_append({
                     "hash": content_hash,
-                    "title": info["title"],
-                    "url": info["url"]
+                    "title": info.title,
+                    "url": info.url
                 })
             else:
-                logger.info(f"[去重] 过滤已推送新闻: {info['title'][:20]}...")
+                logger.info(f"[去重] 过滤已推送新闻: {info.title[:20]}...")
+
+        filtered_stats = list(filtered_by_stat_id.values())
 
         # 构建新的 report_data
         filtered_data = report_data.copy()
@@ -643,99 +839,41 @@ class AppContext:
             filtered_data["stats"] = filtered_stats
             
         # 处理 new_titles (新增列表)
-        if dedup_config.get("dedup_new_titles", True) and "new_titles" in report_data:
-            # handle list structure (from prepare_report_data)
-            if isinstance(report_data["new_titles"], list):
-                new_titles_list = report_data["new_titles"]
-                
-                # 1. Collect all hashes
-                all_hashes = []
-                # hash -> {title, url} for recording lookup is implicit in loop below if we iterate twice
-                # checking is simpler if we just process source by source?
-                # No, batch query is better.
-                
-
-                
-                for source_item in new_titles_list:
-                    source_id = source_item.get("source_id", "")
-                    for title_data in source_item.get("titles", []):
-                        title = title_data.get("title", "")
-                        url = title_data.get("url", "")
-                        h = self.get_content_hash(url, title, source_id)
-                        all_hashes.append(h)
-                
-                # 2. Batch query
-                pushed_hashes = set()
-                if all_hashes:
-                    # remove duplicates in query list
-                    unique_hashes = list(set(all_hashes))
-                    batch_result = self.get_storage_manager().is_news_pushed_batch(unique_hashes)
-                    pushed_hashes = {h for h, is_pushed in batch_result.items() if is_pushed}
-                
-                # 3. Filter and rebuild list
-                filtered_new_titles_list = []
-                
-                for source_item in new_titles_list:
-                    source_id = source_item.get("source_id", "")
-                    filtered_titles = []
-                    
-                    for title_data in source_item.get("titles", []):
-                        title = title_data.get("title", "")
-                        url = title_data.get("url", "")
-                        h = self.get_content_hash(url, title, source_id)
-                        
-                        if h not in pushed_hashes:
-                            filtered_titles.append(title_data)
-                            items_to_record.append({
-                                "hash": h,
-                                "title": title,
-                                "url": url
-                            })
-                    
-                    if filtered_titles:
-                        new_source_item = source_item.copy()
-                        new_source_item["titles"] = filtered_titles
-                        filtered_new_titles_list.append(new_source_item)
-                
-                filtered_data["new_titles"] = filtered_new_titles_list
-            
-            # Fallback for legacy dict structure
-            elif isinstance(report_data["new_titles"], dict):
-                # 收集 new_titles 的 hash
-                new_titles_hash_to_info = {}
-                
-                for source_id, titles_dict in report_data["new_titles"].items():
-                    for title_text, title_info in titles_dict.items():
-                        url = title_info.get("url", "")
-                        content_hash = self.get_content_hash(url, title_text, source_id)
-                        new_titles_hash_to_info[content_hash] = {
-                            "title": title_text,
-                            "url": url,
-                            "source_id": source_id,
-                            "title_info": title_info
-                        }
-                
-                # 批量查询
-                new_titles_pushed_hashes = set()
-                if new_titles_hash_to_info:
-                    batch_result = self.get_storage_manager().is_news_pushed_batch(list(new_titles_hash_to_info.keys()))
-                    new_titles_pushed_hashes = {h for h, is_pushed in batch_result.items() if is_pushed}
-                
-                # 过滤
-                filtered_new_titles = {}
-                for content_hash, info in new_titles_hash_to_info.items():
-                    if content_hash not in new_titles_pushed_hashes:
-                        source_id = info["source_id"]
-                        if source_id not in filtered_new_titles:
-                            filtered_new_titles[source_id] = {}
-                        filtered_new_titles[source_id][info["title"]] = info["title_info"]
-                        items_to_record.append({
-                            "hash": content_hash,
-                            "title": info["title"],
-                            "url": info["url"]
-                        })
-                
-                filtered_data["new_titles"] = filtered_new_titles
+        if isinstance(new_titles, list):
+            # 按来源下标归组保留的标题（条目按来源顺序生成，字典插入顺序即来源顺序）
+            kept_by_source: Dict[int, List[Dict]] = {}
+
+            for source_idx, title_data, h, title, url in new_title_entries:
+                if h not in pushed_hashes:
+                    kept = kept_by_source.get(source_idx)
+                    if kept is None:
+                        kept = kept_by_source[source_idx] = []
+                    kept.append(title_data)
+                    record_append({
+                        "hash": h,
+                        "title": title,
+                        "url": url
+                    })
+
+            # 仅为有保留标题的来源复制一次字典
+            filtered_data["new_titles"] = [
+                {**new_titles[source_idx], "titles": kept}
+                for source_idx, kept in kept_by_source.items()
+            ]
+
+        # Fallback for legacy dict structure
+        elif isinstance(new_titles, dict):
+            filtered_new_titles: Dict[str, Dict] = defaultdict(dict)
+            for content_hash, info in new_titles_hash_to_info.items():
+                if content_hash not in pushed_hashes:
+                    filtered_new_titles[info.source_id][info.title] = info.obj
+                    record_append({
+                        "hash": content_hash,
+                        "title": info.title,
+                        "url": info.url
+                    })
+
+            filtered_data["new_titles"] = dict(filtered_new_titles)
         
         # 记录日志
         original_count = sum(len(s["titles"]) for s in report_data.get("stats", []))
@@ -751,7 +889,7 @@ class AppContext:
         # if not dedup_config.get("enabled", False):
         #    return
 
-        manager = self.get_storage_manager()
+        manager = self.storage_manager
         count = 0
         for item in items:
             if manager.record_pushed_news(item["hash"], item["title"], item["url"]):
@@ -774,47 +912,44 @@ class AppContext:
         Returns:
             (filtered_rss_items, items_to_record)
         """
-        dedup_config = self.config.get("NOTIFICATION", {}).get("deduplication", {})
+        dedup_config = self._dedup_config
         if not dedup_config.get("enabled", False) or not rss_items:
             return rss_items, []
 
         # 第一步：收集所有需要查询的 hash
-        hash_to_info = {}  # {hash: {title, url, feed_id, item}}
-        
+        hash_to_info: Dict[str, _HashInfo] = {}
+        hash_fn = self.get_content_hash
+
         for item in rss_items:
             url = item.get("url", "")
             title = item.get("title", "")
             feed_id = item.get("feed_id", "")
             
-            content_hash = self.get_content_hash(url, title, feed_id)
-            hash_to_info[content_hash] = {
-                "title": title,
-                "url": url,
-                "feed_id": feed_id,
-                "item": item
-            }
+            content_hash = hash_fn(url, title, feed_id)
+            hash_to_info[content_hash] = _HashInfo(title, url, feed_id, item)
         
         # 第二步：批量查询所有 hash 是否已推送
         pushed_hashes = set()
         if hash_to_info:
-            batch_result = self.get_storage_manager().is_news_pushed_batch(list(hash_to_info.keys()))
-            pushed_hashes = {h for h, is_pushed in batch_result.items() if is_pushed}
+            pushed_hashes = self.storage_manager.get_pushed_hashes(list(hash_to_info))
         
         # 第三步：过滤未推送的 RSS 条目
         filtered_items = []
         items_to_record = []
+        filtered_append = filtered_items.append
+        record_append = items_to_record.append
         
         for content_hash, info in hash_to_info.items():
             if content_hash not in pushed_hashes:
                 # 未推送，添加到结果
-                filtered_items.append(info["item"])
-                items_to_record.append({
+                filtered_append(info.obj)
+                record_append({
                     "hash": content_hash,
-                    "title": info["title"],
-                    "url": info["url"]
+                    "title": info.title,
+                    "url": info.url
                 })
             else:
-                # print(f"[去重] 过滤已推送 RSS: {info['title'][:20]}...")
+                # print(f"[去重] 过滤已推送 RSS: {info.title[:20]}...")
                 pass
 
         if len(rss_items) != len(filtered_items):
@@ -826,7 +961,14 @@ class AppContext:
 
     def cleanup(self):
         """清理资源"""
-        if self._storage_manager:
-            self._storage_manager.cleanup_old_data()
-            self._storage_manager.cleanup()
-            self._storage_manager = None
\ No newline at end of file
+        # 仅清理已初始化的存储管理器，并移除缓存以便下次访问重新创建
+        storage_manager = self.__dict__.pop("storage_manager", None)
+        if storage_manager:
+            storage_manager.cleanup_old_data()
+            storage_manager.cleanup()
+
+        # 释放频率词解析缓存，重置运行基准时间
+        clear_frequency_words_cache()
+        self._run_time = None
+        self._run_stamp = None
+        self._freq_words_missing = False
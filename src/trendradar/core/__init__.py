@@ -9,8 +9,12 @@ from trendradar.core.config import (
     limit_accounts,
     get_account_at_index,
 )
-from trendradar.core.loader import load_config
-from trendradar.core.frequency import load_frequency_words, matches_word_groups
+from trendradar.core.loader import load_config, clear_config_cache
+from trendradar.core.frequency import (
+    load_frequency_words,
+    clear_frequency_words_cache,
+    matches_word_groups,
+)
 from trendradar.core.data import (
     save_titles_to_file,
     read_all_today_titles_from_storage,
@@ -21,6 +25,7 @@ from trendradar.core.data import (
 )
 from trendradar.core.analyzer import (
     calculate_news_weight,
+    calculate_news_weights_batch,
     format_time_display,
     count_word_frequency,
     count_rss_frequency,
@@ -32,7 +37,9 @@ __all__ = [
     "limit_accounts",
     "get_account_at_index",
     "load_config",
+    "clear_config_cache",
     "load_frequency_words",
+    "clear_frequency_words_cache",
     "matches_word_groups",
     # 数据处理
     "save_titles_to_file",
@@ -43,6 +50,7 @@ __all__ = [
     "is_first_crawl_today",
     # 统计分析
     "calculate_news_weight",
+    "calculate_news_weights_batch",
     "format_time_display",
     "count_word_frequency",
     "count_rss_frequency",
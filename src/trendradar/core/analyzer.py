@@ -4,14 +4,15 @@
 
 提供新闻统计和分析功能：
 - calculate_news_weight: 计算新闻权重
+- calculate_news_weights_batch: 批量计算新闻权重
 - format_time_display: 格式化时间显示
 - count_word_frequency: 统计词频
 """
 
-from typing import Dict, List, Tuple, Optional, Callable
+from typing import Dict, List, Set, Tuple, Optional, Callable
 from dataclasses import dataclass, field
 
-from trendradar.core.frequency import matches_word_groups, _word_matches
+from trendradar.core.frequency import KeywordMatcher
 from trendradar.core.constants import WEIGHT, RANKING
 import logging
 
@@ -38,6 +39,7 @@ class WordFrequencyConfig:
     
     # 运行时属性
     is_first_today: bool = field(init=False)
+    new_title_keys: Set[Tuple[str, str]] = field(init=False)  # 新增标题的 (source_id, title) 集合
     
     def __post_init__(self):
         if self.weight_config is None:
@@ -55,6 +57,12 @@ class WordFrequencyConfig:
         
         self.is_first_today = self.is_first_crawl_func()
 
+        self.new_title_keys = {
+            (source_id, title)
+            for source_id, titles in (self.new_titles or {}).items()
+            for title in titles
+        }
+
 
 def calculate_news_weight(
     title_data: Dict,
@@ -74,28 +82,7 @@ def calculate_news_weight(
     Returns:
         float: 计算出的权重值
     """
-    ranks = title_data.get("ranks", [])
-    if not ranks:
-        return 0.0
-
-    count = int(title_data.get("count", len(ranks)))
-
-    # 排名权重：Σ(BASE_RANK_SCORE - min(rank, MAX_RANK_SCORE)) / 出现次数
-    rank_weight = _calculate_rank_weight(ranks)
-
-    # 频次权重：min(出现次数, MAX_RANK_SCORE) × FREQUENCY_MULTIPLIER
-    frequency_weight = _calculate_frequency_weight(count)
-
-    # 热度加成：高排名次数 / 总出现次数 × HOTNESS_MULTIPLIER
-    hotness_weight = _calculate_hotness_weight(ranks, rank_threshold)
-
-    total_weight = (
-        rank_weight * weight_config.get("RANK_WEIGHT", WEIGHT.DEFAULT_RANK_WEIGHT)
-        + frequency_weight * weight_config.get("FREQUENCY_WEIGHT", WEIGHT.DEFAULT_FREQUENCY_WEIGHT)
-        + hotness_weight * weight_config.get("HOTNESS_WEIGHT", WEIGHT.DEFAULT_HOTNESS_WEIGHT)
-    )
-
-    return total_weight
+    return calculate_news_weights_batch([title_data], rank_threshold, weight_config)[0]
 
 
 def _calculate_rank_weight(ranks: List[int]) -> float:
@@ -122,6 +109,60 @@ def _calculate_hotness_weight(ranks: List[int], rank_threshold: int) -> float:
     return hotness_ratio * WEIGHT.HOTNESS_MULTIPLIER
 
 
+def calculate_news_weights_batch(
+    titles: List[Dict],
+    rank_threshold: int,
+    weight_config: Dict,
+) -> List[float]:
+    """
+    批量计算新闻权重，结果与逐条调用 calculate_news_weight 一致
+
+    权重配置只读取一次，各分项仍由 _calculate_* 计算，calculate_news_weight 也基于本函数。
+
+    Args:
+        titles: 标题数据列表，每项包含 ranks 和 count
+        rank_threshold: 排名阈值
+        weight_config: 权重配置 {RANK_WEIGHT, FREQUENCY_WEIGHT, HOTNESS_WEIGHT}
+
+    Returns:
+        List[float]: 与 titles 一一对应的权重值
+    """
+    rank_w = weight_config.get("RANK_WEIGHT", WEIGHT.DEFAULT_RANK_WEIGHT)
+    frequency_w = weight_config.get("FREQUENCY_WEIGHT", WEIGHT.DEFAULT_FREQUENCY_WEIGHT)
+    hotness_w = weight_config.get("HOTNESS_WEIGHT", WEIGHT.DEFAULT_HOTNESS_WEIGHT)
+
+    weights = []
+    for title_data in titles:
+        ranks = title_data.get("ranks", [])
+        if not ranks:
+            weights.append(0.0)
+            continue
+
+        count = int(title_data.get("count", len(ranks)))
+
+        # 排名权重：Σ(BASE_RANK_SCORE - min(rank, MAX_RANK_SCORE)) / 出现次数
+        # 频次权重：min(出现次数, MAX_RANK_SCORE) × FREQUENCY_MULTIPLIER
+        # 热度加成：高排名次数 / 总出现次数 × HOTNESS_MULTIPLIER
+        weights.append(
+            _calculate_rank_weight(ranks) * rank_w
+            + _calculate_frequency_weight(count) * frequency_w
+            + _calculate_hotness_weight(ranks, rank_threshold) * hotness_w
+        )
+
+    return weights
+
+
+def _sort_titles_by_weight(titles: List[Dict], rank_threshold: int, weight_config: Dict) -> List[Dict]:
+    """按权重降序、最高排名升序、出现次数降序排列标题（稳定排序）"""
+    weights = calculate_news_weights_batch(titles, rank_threshold, weight_config)
+    keys = [
+        (-weight, min(x["ranks"]) if x["ranks"] else 999, -x["count"])
+        for weight, x in zip(weights, titles)
+    ]
+    order = sorted(range(len(titles)), key=keys.__getitem__)
+    return [titles[i] for i in order]
+
+
 def _determine_processing_scope(config: WordFrequencyConfig, results: Dict) -> Tuple[Dict, bool]:
     """确定处理的数据源和新增标记逻辑"""
     if config.mode == "incremental":
@@ -140,13 +181,18 @@ def _filter_current_batch(config: WordFrequencyConfig, results: Dict) -> Dict:
     if not config.title_info:
         return results
     
+    title_info = config.title_info
+
     # 找到最新时间
-    latest_time = None
-    for source_titles in config.title_info.values():
-        for title_data in source_titles.values():
-            last_time = title_data.get("last_time", "")
-            if last_time and (latest_time is None or last_time > latest_time):
-                latest_time = last_time
+    latest_time = max(
+        (
+            last_time
+            for source_titles in title_info.values()
+            for info in source_titles.values()
+            if (last_time := info.get("last_time"))
+        ),
+        default="",
+    )
     
     if not latest_time:
         return results
@@ -154,15 +200,15 @@ def _filter_current_batch(config: WordFrequencyConfig, results: Dict) -> Dict:
     # 只处理 last_time 等于最新时间的新闻
     results_to_process = {}
     for source_id, source_titles in results.items():
-        if source_id not in config.title_info:
+        source_info = title_info.get(source_id)
+        if source_info is None:
             continue
         
-        filtered_titles = {}
-        for title, title_data in source_titles.items():
-            if title in config.title_info[source_id]:
-                info = config.title_info[source_id][title]
-                if info.get("last_time") == latest_time:
-                    filtered_titles[title] = title_data
+        filtered_titles = {
+            title: title_data
+            for title, title_data in source_titles.items()
+            if source_info.get(title, {}).get("last_time") == latest_time
+        }
         
         if filtered_titles:
             results_to_process[source_id] = filtered_titles
@@ -210,13 +256,15 @@ def _process_title_data(
     mobile_url = source_mobile_url
     image_url = source_image_url
     
-    if config.title_info and source_id in config.title_info and title in config.title_info[source_id]:
-        info = config.title_info[source_id][title]
+    title_info = config.title_info
+    info = title_info.get(source_id, {}).get(title) if title_info else None
+    if info is not None:
         first_time = info.get("first_time", "")
         last_time = info.get("last_time", "")
         count_info = info.get("count", 1)
-        if "ranks" in info and info["ranks"]:
-            ranks = info["ranks"]
+        info_ranks = info.get("ranks")
+        if info_ranks:
+            ranks = info_ranks
         url = info.get("url", source_url)
         mobile_url = info.get("mobileUrl", source_mobile_url)
         image_url = info.get("image_url", source_image_url)
@@ -225,9 +273,7 @@ def _process_title_data(
         ranks = [RANKING.DEFAULT_RANK]
     
     # 判断是否为新增
-    is_new = all_news_are_new
-    if not is_new and config.new_titles and source_id in config.new_titles:
-        is_new = title in config.new_titles[source_id]
+    is_new = all_news_are_new or (source_id, title) in config.new_title_keys
     
     return {
         "title": title,
@@ -270,14 +316,7 @@ def _sort_and_format_stats(
             all_titles.extend(title_list)
         
         # 按权重排序
-        sorted_titles = sorted(
-            all_titles,
-            key=lambda x: (
-                -calculate_news_weight(x, config.rank_threshold, config.weight_config),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
-        )
+        sorted_titles = _sort_titles_by_weight(all_titles, config.rank_threshold, config.weight_config)
         
         # 应用最大显示数量限制
         group_max_count = group_key_to_max_count.get(group_key, 0)
@@ -440,21 +479,25 @@ def count_word_frequency(
 
     # 3. 初始化统计结构
     word_stats, total_titles = _initialize_word_stats(config)
-    processed_titles = {}
+    processed_titles: Set[Tuple[str, str]] = set()
     matched_new_count = 0
     matched_count = 0
 
     # 4. 遍历处理数据
+    # 同一标题常被多个平台收录，匹配器按标题缓存小写化与匹配结果，每个标题只计算一次
+    matcher = KeywordMatcher(config.word_groups, config.filter_words, config.global_filters)
     for source_id, titles_data in results_to_process.items():
         total_titles += len(titles_data)
         
         for title, title_data in titles_data.items():
             # 去重检查 (同一 source_id 下)
-            if source_id in processed_titles and title in processed_titles[source_id]:
+            title_key = (source_id, title)
+            if title_key in processed_titles:
                 continue
 
-            # 匹配检查
-            if not matches_word_groups(title, config.word_groups, config.filter_words, config.global_filters):
+            # 匹配检查（同时确定归属的第一个词组）
+            group = matcher.find_group(title)
+            if group is None:
                 continue
             
             matched_count += 1
@@ -466,39 +509,13 @@ def count_word_frequency(
             # 处理单条数据
             processed_data = _process_title_data(title, title_data, source_id, config, all_news_are_new)
             
-            # 由于上面已经检查了 matches_word_groups，这里我们需要找到具体匹配归属的 group
-            # 为了复用逻辑并准确归类，这里重新遍历 word_groups 查找归属
-            title_lower = str(title).lower()
-            for group in config.word_groups:
-                # 再次匹配确认归属 (处理 "全部新闻" 特例 或 正常匹配)
-                is_match = False
-                if len(config.word_groups) == 1 and config.word_groups[0]["group_key"] == "全部新闻":
-                    is_match = True
-                else:
-                    req_match = not group["required"] or all(_word_matches(w, title_lower) for w in group["required"])
-                    norm_match = not group["normal"] or any(_word_matches(w, title_lower) for w in group["normal"])
-                    # 如果有 required 但不满足 -> False
-                    # 如果没有 required，须满足 normal (如果有 normal) -> True
-                    # 如果 required 和 normal 都没有 -> (逻辑上应该在 matches_word_groups 处理过，这里简化)
-                    if group["required"] and not req_match:
-                        continue
-                    if group["normal"] and not norm_match and not (not group["required"] and not group["normal"]):
-                         continue
-                    is_match = True
-                
-                if is_match:
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                    
-                    word_stats[group_key]["titles"][source_id].append(processed_data)
-                    
-                    # 记录已处理
-                    if source_id not in processed_titles:
-                        processed_titles[source_id] = {}
-                    processed_titles[source_id][title] = True
-                    break
+            # 计入归属词组（"全部新闻" 虚拟词组无必须词与普通词，总是命中）
+            bucket = word_stats[group["group_key"]]
+            bucket["count"] += 1
+            bucket["titles"].setdefault(source_id, []).append(processed_data)
+            
+            # 记录已处理
+            processed_titles.add(title_key)
 
     # 5. 打印汇总信息
     # 计算 total_input_news 用于日志 (Daily 已打印，这里主要针对 Incremental/Current)
@@ -599,14 +616,11 @@ def count_rss_frequency(
     total_items = len(rss_items)
     processed_urls = set()  # 用于去重
 
-    # 为每个条目分配一个基于发布时间的"排名"
-    # 按发布时间排序，最新的排在前面
-    sorted_items = sorted(
-        rss_items,
-        key=lambda x: x.get("published_at", ""),
-        reverse=True
-    )
-    url_to_rank = {item.get("url", ""): idx + 1 for idx, item in enumerate(sorted_items)}
+    # 命中条目的 (url, ranks)，排名在匹配完成后统一回填
+    ranked_entries: List[Tuple[str, List[int]]] = []
+
+    # 批量匹配器（安装 pyahocorasick 时使用自动机单次扫描）
+    matcher = KeywordMatcher(word_groups, filter_words, global_filters)
 
     for item in rss_items:
         title = item.get("title", "")
@@ -618,68 +632,48 @@ def count_rss_frequency(
         if url:
             processed_urls.add(url)
 
-        # 使用统一的匹配逻辑
-        if not matches_word_groups(title, word_groups, filter_words, global_filters):
+        # 使用统一的匹配逻辑，一次得到归属的第一个词组（"全部 RSS" 虚拟词组总是命中）
+        group = matcher.find_group(title)
+        if group is None:
             continue
 
-        # 找到匹配的词组
-        title_lower = title.lower()
-        for group in word_groups:
-            required_words = group["required"]
-            normal_words = group["normal"]
-            group_key = group["group_key"]
-
-            # "全部 RSS" 模式：所有条目都匹配
-            if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部 RSS":
-                matched = True
-            else:
-                # 检查必须词（支持正则语法）
-                if required_words:
-                    all_required_present = all(
-                        _word_matches(req_item, title_lower)
-                        for req_item in required_words
-                    )
-                    if not all_required_present:
-                        continue
-
-                # 检查普通词（支持正则语法）
-                if normal_words:
-                    any_normal_present = any(
-                        _word_matches(normal_item, title_lower)
-                        for normal_item in normal_words
-                    )
-                    if not any_normal_present:
-                        continue
-
-                matched = True
-
-            if matched:
-                word_stats[group_key]["count"] += 1
-
-                # 格式化时间显示
-                published_at = item.get("published_at", "")
-                time_display = format_iso_time_friendly(published_at, timezone, include_date=True) if published_at else ""
-
-                # 判断是否为新增
-                is_new = url in new_urls if url else False
-
-                # 获取排名（基于发布时间顺序）
-                rank = url_to_rank.get(url, 99) if url else 99
-
-                title_data = {
-                    "title": title,
-                    "source_name": item.get("feed_name", item.get("feed_id", "RSS")),
-                    "time_display": time_display,
-                    "count": 1,  # RSS 条目通常只出现一次
-                    "ranks": [rank],
-                    "rank_threshold": rank_threshold,
-                    "url": url,
-                    "mobile_url": "",
-                    "image_url": item.get("image_url", ""),
-                    "is_new": is_new,
-                }
-                word_stats[group_key]["titles"].append(title_data)
-                break  # 一个条目只匹配第一个词组
+        group_key = group["group_key"]
+        word_stats[group_key]["count"] += 1
+
+        # 格式化时间显示
+        published_at = item.get("published_at", "")
+        time_display = format_iso_time_friendly(published_at, timezone, include_date=True) if published_at else ""
+
+        # 判断是否为新增
+        is_new = url in new_urls if url else False
+
+        # 排名（基于发布时间顺序）待回填，无链接的条目固定为 99
+        ranks = [99]
+        if url:
+            ranked_entries.append((url, ranks))
+
+        title_data = {
+            "title": title,
+            "source_name": item.get("feed_name", item.get("feed_id", "RSS")),
+            "time_display": time_display,
+            "count": 1,  # RSS 条目通常只出现一次
+            "ranks": ranks,
+            "rank_threshold": rank_threshold,
+            "url": url,
+            "mobile_url": "",
+            "image_url": item.get("image_url", ""),
+            "is_new": is_new,
+        }
+        word_stats[group_key]["titles"].append(title_data)
+
+    # 为命中条目分配基于发布时间的"排名"（在全部条目中按发布时间倒序，最新的排在前面）
+    # 只排序下标而非条目字典，且没有条目命中时跳过排序
+    if ranked_entries:
+        published = [item.get("published_at", "") for item in rss_items]
+        order = sorted(range(total_items), key=published.__getitem__, reverse=True)
+        url_to_rank = {rss_items[idx].get("url", ""): pos for pos, idx in enumerate(order, 1)}
+        for url, ranks in ranked_entries:
+            ranks[0] = url_to_rank[url]
 
     # 构建统计结果
     stats = []
@@ -768,25 +762,18 @@ def convert_keyword_stats_to_platform_stats(
 
     # 2. 去重（同一平台下相同标题只保留一条，保留第一个匹配的关键词）
     for source_name, titles in platform_map.items():
-        seen_titles: Dict[str, bool] = {}
+        seen_titles: Set[str] = set()
         unique_titles = []
         for title_data in titles:
             title_text = title_data["title"]
             if title_text not in seen_titles:
-                seen_titles[title_text] = True
+                seen_titles.add(title_text)
                 unique_titles.append(title_data)
         platform_map[source_name] = unique_titles
 
     # 3. 按权重排序每个平台内的新闻
     for source_name, titles in platform_map.items():
-        platform_map[source_name] = sorted(
-            titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold, weight_config),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
-        )
+        platform_map[source_name] = _sort_titles_by_weight(titles, rank_threshold, weight_config)
 
     # 4. 构建平台统计结果
     platform_stats = []
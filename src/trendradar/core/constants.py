@@ -41,6 +41,10 @@ class BatchConstants:
 class TimeoutConstants:
     """超时时间常量"""
     HTTP_REQUEST_TIMEOUT: int = 30
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+    HTTP_WRITE_TIMEOUT: float = 10.0
+    HTTP_POOL_TIMEOUT: float = 5.0
+    HTTP_CLOSE_TIMEOUT: float = 5.0
     CRAWLER_REQUEST_TIMEOUT: int = 15
     LLM_REQUEST_TIMEOUT: int = 30
     SMTP_CONNECTION_TIMEOUT: int = 10
@@ -66,8 +70,10 @@ class CacheConstants:
 class ConcurrencyConstants:
     """并发控制常量"""
     RSS_MAX_CONCURRENCY: int = 5
-    HTTP_MAX_CONNECTIONS: int = 100
-    HTTP_MAX_KEEPALIVE: int = 20
+    IMAGE_CACHE_MAX_CONCURRENCY: int = 16
+    HTTP_MAX_CONNECTIONS: int = 1000
+    HTTP_MAX_KEEPALIVE: int = 100
+    HTTP_KEEPALIVE_EXPIRY: float = 60.0  # 秒，覆盖轮询间隔，低于常见服务端 keepalive 超时（nginx 默认 75s）
 
 
 @dataclass
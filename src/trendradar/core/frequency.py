@@ -14,9 +14,19 @@
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Union
 
+try:
+    import ahocorasick  # 可选依赖：pyahocorasick，用于批量关键词匹配
+except ImportError:
+    ahocorasick = None
+
+
+# 频率词解析缓存：{文件绝对路径: ((mtime_ns, size), (词组, 过滤词, 全局过滤词))}
+_FREQUENCY_WORDS_CACHE: Dict[str, Tuple[Tuple[int, int], Tuple]] = {}
+
 
 def _parse_word(word: str) -> Dict:
     """
@@ -32,7 +42,7 @@ def _parse_word(word: str) -> Dict:
         word: 原始词
 
     Returns:
-        {"word": str, "is_regex": bool, "pattern": Optional[re.Pattern], "display_name": Optional[str]}
+        {"word": str, "word_lower": str, "is_regex": bool, "pattern": Optional[re.Pattern], "display_name": Optional[str]}
     """
     display_name = None
 
@@ -54,6 +64,7 @@ def _parse_word(word: str) -> Dict:
             pattern = re.compile(pattern_str, re.IGNORECASE)
             return {
                 "word": pattern_str,
+                "word_lower": pattern_str.lower(),
                 "is_regex": True,
                 "pattern": pattern,
                 "display_name": display_name,
@@ -62,7 +73,14 @@ def _parse_word(word: str) -> Dict:
             # 正则表达式无效，当作普通词处理
             pass
 
-    return {"word": word, "is_regex": False, "pattern": None, "display_name": display_name}
+    # 小写形式在解析时预先计算，避免每个标题匹配时重复调用 lower()
+    return {
+        "word": word,
+        "word_lower": word.lower(),
+        "is_regex": False,
+        "pattern": None,
+        "display_name": display_name,
+    }
 
 
 def _word_matches(word_config: Union[str, Dict], title_lower: str) -> bool:
@@ -80,12 +98,16 @@ def _word_matches(word_config: Union[str, Dict], title_lower: str) -> bool:
         # 向后兼容：纯字符串
         return word_config.lower() in title_lower
 
-    if word_config.get("is_regex") and word_config.get("pattern"):
+    pattern = word_config.get("pattern")
+    if pattern is not None and word_config.get("is_regex"):
         # 正则匹配
-        return bool(word_config["pattern"].search(title_lower))
-    else:
-        # 子字符串匹配
-        return word_config["word"].lower() in title_lower
+        return pattern.search(title_lower) is not None
+
+    # 子字符串匹配（优先使用解析时预计算的小写形式）
+    word_lower = word_config.get("word_lower")
+    if word_lower is None:
+        word_lower = word_config["word"].lower()
+    return word_lower in title_lower
 
 
 def load_frequency_words(
@@ -123,9 +145,39 @@ def load_frequency_words(
     if not frequency_path.exists():
         raise FileNotFoundError(f"频率词文件 {frequency_file} 不存在")
 
-    with open(frequency_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    # 按文件修改时间与大小缓存解析结果，文件未变化时直接复用
+    stat = frequency_path.stat()
+    cache_key = str(frequency_path.resolve())
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _FREQUENCY_WORDS_CACHE.get(cache_key)
+    if cached is None or cached[0] != signature:
+        with open(frequency_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        cached = (signature, _parse_frequency_content(content))
+        _FREQUENCY_WORDS_CACHE[cache_key] = cached
+
+    # 返回列表副本，调用方修改列表不会污染缓存
+    processed_groups, filter_words, global_filters = cached[1]
+    return list(processed_groups), list(filter_words), list(global_filters)
+
+
+def clear_frequency_words_cache() -> None:
+    """清空频率词解析缓存（下次加载时重新读取文件）"""
+    _FREQUENCY_WORDS_CACHE.clear()
 
+
+def _parse_frequency_content(
+    content: str,
+) -> Tuple[Tuple[Dict, ...], Tuple[Dict, ...], Tuple[str, ...]]:
+    """
+    解析频率词配置文件内容
+
+    Args:
+        content: 配置文件文本
+
+    Returns:
+        (词组, 词组内过滤词, 全局过滤词) 的不可变元组
+    """
     word_groups = [group.strip() for group in content.split("\n\n") if group.strip()]
 
     processed_groups = []
@@ -213,7 +265,17 @@ def load_frequency_words(
                 }
             )
 
-    return processed_groups, filter_words, global_filters
+    return tuple(processed_groups), tuple(filter_words), tuple(global_filters)
+
+
+@lru_cache(maxsize=32)
+def _global_filter_pattern(global_filters: Tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    将全局过滤词编译为单个正则（按过滤词元组缓存）
+
+    过滤词先转小写再转义，匹配小写标题，与逐词 `in` 判断语义一致。
+    """
+    return re.compile("|".join(re.escape(word.lower()) for word in global_filters))
 
 
 def matches_word_groups(
@@ -234,49 +296,141 @@ def matches_word_groups(
     Returns:
         是否匹配
     """
-    # 防御性类型检查：确保 title 是有效字符串
-    if not isinstance(title, str):
-        title = str(title) if title is not None else ""
-    if not title.strip():
-        return False
-
-    title_lower = title.lower()
+    # 单次匹配无需构建自动机；匹配规则统一由 KeywordMatcher 实现
+    return KeywordMatcher(
+        word_groups, filter_words, global_filters, use_automaton=False
+    ).matches(title)
 
-    # 全局过滤检查（优先级最高）
-    if global_filters:
-        if any(global_word.lower() in title_lower for global_word in global_filters):
-            return False
 
-    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
-    if not word_groups:
-        return True
+class KeywordMatcher:
+    """
+    批量标题匹配器（词组、过滤词、全局过滤词匹配规则的唯一实现）
 
-    # 过滤词检查（兼容新旧格式）
-    for filter_item in filter_words:
-        if _word_matches(filter_item, title_lower):
-            return False
+    构建时将所有词预编译为 (是否正则, 小写词 / 正则对象)，匹配时不再逐词解析配置。
+    安装了 pyahocorasick 时，所有普通词与全局过滤词构建为一个 Aho-Corasick 自动机，
+    每个标题只需线性扫描一次即可得到全部命中的词；未安装时普通词直接做子串判断。正则词逐个匹配。
 
-    # 词组匹配检查
-    for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
+    匹配结果（命中词组下标）按标题缓存，多个源转载的相同标题只匹配一次（匹配器按批次创建，缓存随之释放）。
+    """
 
-        # 必须词检查
-        if required_words:
-            all_required_present = all(
-                _word_matches(req_item, title_lower) for req_item in required_words
-            )
-            if not all_required_present:
+    # 未配置词组时的匹配结果：匹配但不归属任何词组
+    _MATCH_ALL = -1
+    # 缓存未命中标记（None 是合法的缓存结果）
+    _UNSET = object()
+
+    def __init__(
+        self,
+        word_groups: List[Dict],
+        filter_words: List,
+        global_filters: Optional[List[str]] = None,
+        use_automaton: bool = True,
+    ):
+        self.word_groups = word_groups
+        self.filter_words = filter_words
+        self.global_filters = global_filters
+        self._verdicts: Dict[str, Optional[int]] = {}
+        self._automaton = None
+
+        plain_words = set()
+
+        def _compile(word_config: Union[str, Dict]) -> Tuple[bool, object]:
+            # 编译为 (是否正则, 小写词 / 正则对象)
+            if isinstance(word_config, str):
+                word_lower = word_config.lower()
+            elif word_config.get("is_regex") and word_config.get("pattern") is not None:
+                return True, word_config["pattern"]
+            else:
+                word_lower = word_config.get("word_lower")
+                if word_lower is None:
+                    word_lower = word_config["word"].lower()
+            plain_words.add(word_lower)
+            return False, word_lower
+
+        self._global = [w.lower() for w in (global_filters or [])]
+        plain_words.update(self._global)
+        self._filters = [_compile(w) for w in filter_words]
+        self._groups = [
+            ([_compile(w) for w in group["required"]], [_compile(w) for w in group["normal"]])
+            for group in word_groups
+        ]
+        # 未使用自动机时，全局过滤词合并为单个正则
+        self._global_pattern = _global_filter_pattern(tuple(global_filters)) if global_filters else None
+
+        if ahocorasick is None or not use_automaton:
+            return
+
+        automaton = ahocorasick.Automaton()
+        for word in plain_words:
+            # 空串在任意标题中都成立，单独处理
+            if word:
+                automaton.add_word(word, word)
+        # 只有正则词（或空词）时无需自动机
+        if len(automaton) > 0:
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def matches(self, title: str) -> bool:
+        """检查标题是否匹配词组规则"""
+        return self._lookup(title) is not None
+
+    def find_group(self, title: str) -> Optional[Dict]:
+        """查找标题匹配的第一个词组，未匹配或未配置词组时返回 None"""
+        idx = self._lookup(title)
+        if idx is None or idx == self._MATCH_ALL:
+            return None
+        return self.word_groups[idx]
+
+    def _lookup(self, title: str) -> Optional[int]:
+        """按标题缓存匹配结果"""
+        if not isinstance(title, str):
+            return self._match(title)
+
+        idx = self._verdicts.get(title, self._UNSET)
+        if idx is self._UNSET:
+            idx = self._verdicts[title] = self._match(title)
+        return idx
+
+    def _match(self, title: str) -> Optional[int]:
+        """执行实际匹配（不经过缓存），返回命中词组下标，未配置词组时返回 _MATCH_ALL"""
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+        if not title.strip():
+            return None
+
+        title_lower = title.lower()
+
+        if self._automaton is not None:
+            # 自动机单次扫描得到全部命中的普通词（空词恒成立）
+            found = {""}
+            found.update(word for _, word in self._automaton.iter(title_lower))
+            contains = found.__contains__
+            # 全局过滤检查（优先级最高）
+            if any(word in found for word in self._global):
+                return None
+        else:
+            contains = title_lower.__contains__
+            # 全局过滤检查（优先级最高）
+            if self._global_pattern is not None and self._global_pattern.search(title_lower):
+                return None
+
+        def _hit(compiled: Tuple[bool, object]) -> bool:
+            is_regex, target = compiled
+            if is_regex:
+                return target.search(title_lower) is not None
+            return contains(target)
+
+        # 如果没有配置词组，则匹配所有标题
+        if not self.word_groups:
+            return self._MATCH_ALL
+
+        if any(_hit(f) for f in self._filters):
+            return None
+
+        for idx, (required, normal) in enumerate(self._groups):
+            if required and not all(_hit(w) for w in required):
                 continue
-
-        # 普通词检查
-        if normal_words:
-            any_normal_present = any(
-                _word_matches(normal_item, title_lower) for normal_item in normal_words
-            )
-            if not any_normal_present:
+            if normal and not any(_hit(w) for w in normal):
                 continue
+            return idx
 
-        return True
-
-    return False
\ No newline at end of file
+        return None
@@ -6,7 +6,7 @@ LLM 服务接口
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import AsyncIterator, Dict, List
 
 
 class LLMServiceInterface(ABC):
@@ -65,4 +65,20 @@ class LLMServiceInterface(ABC):
         Returns:
             str: AI 的回复内容
         """
+        pass
+
+    @abstractmethod
+    def ask_stream(
+        self, prompt: str, system_prompt: str = "You are a helpful assistant."
+    ) -> AsyncIterator[str]:
+        """
+        发送自定义 Prompt 并以流式方式获取回复
+
+        Args:
+            prompt: 用户提示词
+            system_prompt: 系统提示词
+
+        Returns:
+            逐段产出回复内容的异步迭代器
+        """
         pass
\ No newline at end of file
@@ -6,9 +6,10 @@ LLM 服务模块
 用于对新闻标题进行评分、分类和摘要。
 """
 
+import asyncio
 import json
 import logging
-from typing import List, Dict
+from typing import AsyncIterator, List, Dict, Tuple
 import httpx
 
 from trendradar.core.llm_interface import LLMServiceInterface
@@ -45,16 +46,19 @@ class LLMService(LLMServiceInterface):
         初始化 LLM 服务
 
         Args:
-            config: 配置字典，包含 LLM 相关配置
+            config: 配置字典（load_config 的输出），LLM 配置位于 config["LLM"]，键为大写
         """
         self.config = config.get("LLM", {})
         
-        self.enabled = self.config.get("enabled", False)
-        self.provider = self.config.get("provider", "ollama")
-        self.base_url = self.config.get("base_url", "http://localhost:11434")
-        self.api_key = self.config.get("api_key", "sk-placeholder")
-        self.model = self.config.get("model", "qwen2.5:7b")
-        self.batch_size = self.config.get("batch_size", 10)
+        self.enabled = self.config.get("ENABLED", False)
+        self.provider = self.config.get("PROVIDER", "ollama")
+        self.base_url = self.config.get("BASE_URL", "http://localhost:11434")
+        self.api_key = self.config.get("API_KEY") or "sk-placeholder"
+        self.model = self.config.get("MODEL", "qwen2.5:7b")
+        self.batch_size = self.config.get("BATCH_SIZE", 10)
+        self.max_concurrency = max(1, int(self.config.get("MAX_CONCURRENCY") or 4))
+        # 自定义 Prompt（ask / ask_stream）的采样温度
+        self.temperature = 0.7
         
         # 针对不同提供商调整 API 路径
         if self.provider == "ollama":
@@ -77,13 +81,20 @@ class LLMService(LLMServiceInterface):
         if not self.enabled or not titles:
             return {t: 0.0 for t in titles}
 
-        scores = {}
         total = len(titles)
-        
-        # 分批处理
-        for i in range(0, total, self.batch_size):
-            batch = titles[i : i + self.batch_size]
-            batch_scores = await self._process_batch(batch)
+        batches = [titles[i : i + self.batch_size] for i in range(0, total, self.batch_size)]
+
+        # 分批并发处理，限制同时在途的请求数
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _run(batch: List[str]) -> Dict[str, float]:
+            async with semaphore:
+                return await self._process_batch(batch)
+
+        results = await asyncio.gather(*(_run(batch) for batch in batches))
+
+        scores = {}
+        for batch_scores in results:
             scores.update(batch_scores)
             
         return scores
@@ -94,7 +105,7 @@ class LLMService(LLMServiceInterface):
         indexed_titles = {str(i): title for i, title in enumerate(batch_titles)}
         news_list_str = "\n".join([f"[{i}] {t}" for i, t in enumerate(batch_titles)])
         
-        prompt = self.config.get("prompt_template") or self.DEFAULT_PROMPT_TEMPLATE
+        prompt = self.config.get("PROMPT_TEMPLATE") or self.DEFAULT_PROMPT_TEMPLATE
         prompt = prompt.format(news_list=news_list_str)
 
         try:
@@ -176,6 +187,33 @@ class LLMService(LLMServiceInterface):
 
         return filtered
 
+    def _build_chat_request(
+        self, prompt: str, system_prompt: str, stream: bool = False
+    ) -> Tuple[str, Dict[str, str], Dict]:
+        """
+        构造自定义 Prompt 的 chat/completions 请求（ask 与 ask_stream 共用）
+
+        Returns:
+            Tuple[str, Dict, Dict]: (请求 URL, 请求头, 请求体)
+        """
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": self.temperature,
+        }
+        if stream:
+            payload["stream"] = True
+
+        return f"{self.base_url}/chat/completions", headers, payload
+
     async def ask(self, prompt: str, system_prompt: str = "You are a helpful assistant.") -> str:
         """
         发送自定义 Prompt 并获取回复
@@ -190,27 +228,11 @@ class LLMService(LLMServiceInterface):
         if not self.enabled:
             return "LLM service is disabled."
 
+        url, headers, payload = self._build_chat_request(prompt, system_prompt)
+
         try:
             async with httpx.AsyncClient(timeout=60.0) as client:
-                headers = {
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                }
-                
-                payload = {
-                    "model": self.model,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.7,
-                }
-
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload
-                )
+                response = await client.post(url, headers=headers, json=payload)
                 response.raise_for_status()
                 
                 result = response.json()
@@ -219,6 +241,51 @@ class LLMService(LLMServiceInterface):
         except Exception as e:
             return f"LLM Request failed: {e}"
 
+    async def ask_stream(
+        self, prompt: str, system_prompt: str = "You are a helpful assistant."
+    ) -> AsyncIterator[str]:
+        """
+        发送自定义 Prompt 并以流式方式逐段返回回复
+
+        Args:
+            prompt: 用户提示词
+            system_prompt: 系统提示词
+
+        Yields:
+            str: AI 回复的增量片段；请求失败时产出一条 "LLM Request failed: ..." 信息
+        """
+        if not self.enabled:
+            yield "LLM service is disabled."
+            return
+
+        url, headers, payload = self._build_chat_request(prompt, system_prompt, stream=True)
+
+        try:
+            async with httpx.AsyncClient(timeout=60.0) as client:
+                async with client.stream("POST", url, headers=headers, json=payload) as response:
+                    response.raise_for_status()
+
+                    # OpenAI 兼容协议的 SSE 格式: "data: {...}"，以 "data: [DONE]" 结束
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == "[DONE]":
+                            break
+                        try:
+                            chunk = json.loads(data)
+                        except json.JSONDecodeError:
+                            continue
+                        choices = chunk.get("choices") or []
+                        if not choices:
+                            continue
+                        delta = choices[0].get("delta", {}).get("content")
+                        if delta:
+                            yield delta
+
+        except Exception as e:
+            yield f"LLM Request failed: {e}"
+
     def is_enabled(self) -> bool:
         """
         检查 LLM 服务是否启用
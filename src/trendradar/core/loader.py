@@ -5,9 +5,10 @@
 负责从 YAML 配置文件和环境变量加载配置。
 """
 
+import copy
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 import yaml
 import logging
@@ -22,6 +23,9 @@ from .config import (
     detect_sensitive_info,
 )
 
+# YAML 解析缓存：{文件绝对路径: ((mtime_ns, size), 原始配置数据)}
+_CONFIG_DATA_CACHE: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+
 
 def _get_env_bool(key: str, default: bool = False) -> Optional[bool]:
     """从环境变量获取布尔值，如果未设置返回 None"""
@@ -396,6 +400,9 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     加载配置文件
 
+    YAML 解析结果按文件修改时间与大小缓存；环境变量覆盖每次调用都重新应用，
+    且每次返回独立的配置字典。
+
     Args:
         config_path: 配置文件路径，默认从环境变量 CONFIG_PATH 获取或使用 config/config.yaml
 
@@ -408,11 +415,7 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     if config_path is None:
         config_path = os.environ.get("CONFIG_PATH", "config/config.yaml")
 
-    if not Path(config_path).exists():
-        raise FileNotFoundError(f"配置文件 {config_path} 不存在")
-
-    with open(config_path, "r", encoding="utf-8") as f:
-        config_data = yaml.safe_load(f)
+    config_data = _read_config_data(config_path)
 
     logger.info(f"配置文件加载成功: {config_path}")
 
@@ -467,6 +470,29 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     return config
 
 
+def _read_config_data(config_path: str) -> Dict:
+    """读取并解析 YAML 配置文件，文件未变化时复用缓存（返回深拷贝，调用方修改不会污染缓存）"""
+    path = Path(config_path)
+    if not path.exists():
+        raise FileNotFoundError(f"配置文件 {config_path} 不存在")
+
+    stat = path.stat()
+    cache_key = str(path.resolve())
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_DATA_CACHE.get(cache_key)
+    if cached is None or cached[0] != signature:
+        with open(path, "r", encoding="utf-8") as f:
+            cached = (signature, yaml.safe_load(f))
+        _CONFIG_DATA_CACHE[cache_key] = cached
+
+    return copy.deepcopy(cached[1])
+
+
+def clear_config_cache() -> None:
+    """清空配置文件解析缓存（下次加载时重新读取文件）"""
+    _CONFIG_DATA_CACHE.clear()
+
+
 def _load_llm_config(config_data: Dict) -> Dict:
     """加载智能分析 (LLM) 配置"""
     llm = config_data.get("llm", {})
@@ -481,5 +507,6 @@ def _load_llm_config(config_data: Dict) -> Dict:
         "MODEL": _get_env_str("LLM_MODEL") or llm.get("model", "qwen2.5:7b"),
         "SCORE_THRESHOLD": llm.get("score_threshold", 6.0),
         "BATCH_SIZE": llm.get("batch_size", 10),
+        "MAX_CONCURRENCY": llm.get("max_concurrency") or 4,
         "PROMPT_TEMPLATE": llm.get("prompt_template", ""),
     }
\ No newline at end of file
@@ -44,6 +44,7 @@ class AsyncRSSFetcher:
         freshness_enabled: bool = True,
         default_max_age_days: int = 3,
         max_concurrency: int = 5,
+        client: Optional[httpx.AsyncClient] = None,
     ):
         """
         初始化抓取器
@@ -58,6 +59,7 @@ class AsyncRSSFetcher:
             freshness_enabled: 是否启用新鲜度过滤
             default_max_age_days: 默认最大文章年龄（天）
             max_concurrency: 最大并发数
+            client: 共享的 HTTP 客户端（复用连接池）；需要代理时仍使用独立客户端
         """
         self.feeds = [f for f in feeds if f.enabled]
         self.request_interval = request_interval
@@ -83,6 +85,9 @@ class AsyncRSSFetcher:
         if use_proxy and proxy_url:
             self.client_args["proxy"] = proxy_url
 
+        # 代理只能在客户端级别设置，因此仅在不走代理时复用共享客户端
+        self.client = client if "proxy" not in self.client_args else None
+
     async def fetch_feed(self, client: httpx.AsyncClient, feed: RSSFeedConfig) -> Tuple[List[RSSItem], Optional[str]]:
         """
         抓取单个 RSS 源 (异步)
@@ -95,14 +100,16 @@ class AsyncRSSFetcher:
         """
         async with self.semaphore:
             try:
-                response = await client.get(feed.url)
+                # 显式传入 RSS 专用请求头与超时，共享客户端时同样生效
+                response = await client.get(
+                    feed.url,
+                    headers=self.client_args["headers"],
+                    timeout=self.client_args["timeout"],
+                )
                 response.raise_for_status()
 
-                parsed_items = self.parser.parse(response.text, feed.url)
-
-                # 限制条目数量（0=不限制）
-                if feed.max_items > 0:
-                    parsed_items = parsed_items[:feed.max_items]
+                # 限制条目数量（0=不限制），解析时达到上限即停止处理后续条目
+                parsed_items = self.parser.parse(response.text, feed.url, max_items=feed.max_items)
 
                 # 转换为 RSSItem（使用配置的时区）
                 now = get_configured_time(self.timezone)
@@ -151,9 +158,12 @@ class AsyncRSSFetcher:
 
         logging.getLogger('TrendRadar').info(f"[RSS] 开始抓取 {len(self.feeds)} 个 RSS 源 (并发)...")
 
-        async with httpx.AsyncClient(**self.client_args) as client:
-            tasks = [self.fetch_feed(client, feed) for feed in self.feeds]
-            results = await asyncio.gather(*tasks)
+        if self.client:
+            results = await asyncio.gather(*[self.fetch_feed(self.client, feed) for feed in self.feeds])
+        else:
+            async with httpx.AsyncClient(**self.client_args) as client:
+                tasks = [self.fetch_feed(client, feed) for feed in self.feeds]
+                results = await asyncio.gather(*tasks)
 
         for i, (items, error) in enumerate(results):
             feed = self.feeds[i]
@@ -316,13 +326,16 @@ class RSSFetcher:
         if max_days == 0:
             return items, 0
 
+        # 当前时间只获取一次，避免逐条解析时区
+        now = get_configured_time(self.timezone)
+
         # 过滤逻辑：无发布时间的文章保留
         filtered = []
         for item in items:
             if not item.published_at:
                 # 无发布时间，保留
                 filtered.append(item)
-            elif is_within_days(item.published_at, max_days, self.timezone):
+            elif is_within_days(item.published_at, max_days, self.timezone, now=now):
                 # 在指定天数内，保留
                 filtered.append(item)
             # 否则过滤掉
@@ -344,11 +357,8 @@ class RSSFetcher:
             response = self.session.get(feed.url, timeout=self.timeout)
             response.raise_for_status()
 
-            parsed_items = self.parser.parse(response.text, feed.url)
-
-            # 限制条目数量（0=不限制）
-            if feed.max_items > 0:
-                parsed_items = parsed_items[:feed.max_items]
+            # 限制条目数量（0=不限制），解析时达到上限即停止处理后续条目
+            parsed_items = self.parser.parse(response.text, feed.url, max_items=feed.max_items)
 
             # 转换为 RSSItem（使用配置的时区）
             now = get_configured_time(self.timezone)
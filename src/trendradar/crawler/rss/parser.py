@@ -10,7 +10,7 @@ import html
 import json
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any
 from email.utils import parsedate_to_datetime
 
 from trendradar.utils.image import extract_main_image, is_valid_image_url
@@ -23,6 +23,34 @@ except ImportError:
     feedparser = None
 
 
+FeedType = Literal["json", "rss", "atom", "rdf", "unknown"]
+
+# 类型探测只检查内容开头的一小段
+FEED_SNIFF_LENGTH = 512
+
+
+def detect_feed_type(content: str) -> FeedType:
+    """
+    通过内容前缀快速识别 Feed 类型（不做完整解析）
+
+    Args:
+        content: Feed 内容
+
+    Returns:
+        "json" / "rss" / "atom" / "rdf"，无法识别时返回 "unknown"
+    """
+    prefix = content[:FEED_SNIFF_LENGTH].lstrip("\ufeff \t\r\n")
+    if prefix.startswith("{"):
+        return "json"
+    if "<rss" in prefix:
+        return "rss"
+    if "<feed" in prefix:
+        return "atom"
+    if "<rdf:RDF" in prefix:
+        return "rdf"
+    return "unknown"
+
+
 @dataclass
 class ParsedRSSItem:
     """解析后的 RSS 条目"""
@@ -50,22 +78,25 @@ class RSSParser:
 
         self.max_summary_length = max_summary_length
 
-    def parse(self, content: str, feed_url: str = "") -> List[ParsedRSSItem]:
+    def parse(self, content: str, feed_url: str = "", max_items: int = 0) -> List[ParsedRSSItem]:
         """
         解析 RSS/Atom/JSON Feed 内容
 
         Args:
             content: Feed 内容（XML 或 JSON）
             feed_url: Feed URL（用于错误提示）
+            max_items: 最多保留的有效条目数（0=不限制），达到后不再处理剩余条目
 
         Returns:
             解析后的条目列表
         """
-        # 先尝试检测 JSON Feed
-        if self._is_json_feed(content):
-            return self._parse_json_feed(content, feed_url)
+        # 先按前缀识别类型，JSON Feed 只解析一次 JSON
+        if detect_feed_type(content) == "json":
+            data = self._load_json_feed(content)
+            if data is not None:
+                return self._parse_json_feed(data, max_items)
 
-        # 使用 feedparser 解析 RSS/Atom
+        # 使用 feedparser 解析 RSS/Atom/RDF
         feed = feedparser.parse(content)
 
         if feed.bozo and not feed.entries:
@@ -76,44 +107,40 @@ class RSSParser:
             item = self._parse_entry(entry)
             if item:
                 items.append(item)
+                # 条目的清洗与图片提取开销较大，达到上限后提前结束
+                if max_items > 0 and len(items) >= max_items:
+                    break
 
         return items
 
-    def _is_json_feed(self, content: str) -> bool:
+    def _load_json_feed(self, content: str) -> Optional[Dict[str, Any]]:
         """
-        检测内容是否为 JSON Feed 格式
+        加载 JSON Feed 内容，不是 JSON Feed 格式时返回 None
 
         JSON Feed 必须包含 version 字段，值为 https://jsonfeed.org/version/1 或 1.1
         """
-        content = content.strip()
-        if not content.startswith("{"):
-            return False
-
         try:
             data = json.loads(content)
             version = data.get("version", "")
-            return "jsonfeed.org" in version
-        except (json.JSONDecodeError, TypeError):
-            return False
+            if "jsonfeed.org" in version:
+                return data
+        except (json.JSONDecodeError, TypeError, AttributeError):
+            pass
+        return None
 
-    def _parse_json_feed(self, content: str, feed_url: str = "") -> List[ParsedRSSItem]:
+    def _parse_json_feed(self, data: Dict[str, Any], max_items: int = 0) -> List[ParsedRSSItem]:
         """
         解析 JSON Feed 1.1 格式
 
         JSON Feed 规范: https://www.jsonfeed.org/version/1.1/
 
         Args:
-            content: JSON Feed 内容
-            feed_url: Feed URL（用于错误提示）
+            data: 已加载的 JSON Feed 数据
+            max_items: 最多保留的有效条目数（0=不限制）
 
         Returns:
             解析后的条目列表
         """
-        try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"JSON Feed 解析失败 ({feed_url}): {e}")
-
         items_data = data.get("items", [])
         if not items_data:
             return []
@@ -123,6 +150,8 @@ class RSSParser:
             item = self._parse_json_feed_item(item_data)
             if item:
                 items.append(item)
+                if max_items > 0 and len(items) >= max_items:
+                    break
 
         return items
 
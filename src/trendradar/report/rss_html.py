@@ -331,7 +331,8 @@ def render_rss_html_content(
             feeds_map[feed_id] = []
         feeds_map[feed_id].append(item)
 
-    # 渲染每个 RSS 源的内容
+    # 渲染每个 RSS 源的内容（片段收集到列表中，最后一次性拼接，避免反复复制大字符串）
+    parts: List[str] = []
     for feed_id, items in feeds_map.items():
         feed_name = items[0].get("feed_name", feed_id) if items else feed_id
         if feeds_info and feed_id in feeds_info:
@@ -339,12 +340,12 @@ def render_rss_html_content(
 
         escaped_feed_name = html_escape(feed_name)
 
-        html += f"""
+        parts.append(f"""
                 <div class="feed-group">
                     <div class="feed-header">
                         <div class="feed-name">{escaped_feed_name}</div>
                         <div class="feed-count">{len(items)} 条</div>
-                    </div>"""
+                    </div>""")
 
         for item in items:
             escaped_title = html_escape(item.get("title", ""))
@@ -353,39 +354,41 @@ def render_rss_html_content(
             author = item.get("author", "")
             summary = item.get("summary", "")
 
-            html += """
+            parts.append("""
                     <div class="rss-item">
-                        <div class="rss-meta">"""
+                        <div class="rss-meta">""")
 
             if published_at:
-                html += f'<span class="rss-time">{html_escape(published_at)}</span>'
+                parts.append(f'<span class="rss-time">{html_escape(published_at)}</span>')
 
             if author:
-                html += f'<span class="rss-author">by {html_escape(author)}</span>'
+                parts.append(f'<span class="rss-author">by {html_escape(author)}</span>')
 
-            html += """
+            parts.append("""
                         </div>
-                        <div class="rss-title">"""
+                        <div class="rss-title">""")
 
             if url:
                 escaped_url = html_escape(url)
-                html += f'<a href="{escaped_url}" target="_blank" class="rss-link">{escaped_title}</a>'
+                parts.append(f'<a href="{escaped_url}" target="_blank" class="rss-link">{escaped_title}</a>')
             else:
-                html += escaped_title
+                parts.append(escaped_title)
 
-            html += """
-                        </div>"""
+            parts.append("""
+                        </div>""")
 
             if summary:
                 escaped_summary = html_escape(summary)
-                html += f"""
-                        <p class="rss-summary">{escaped_summary}</p>"""
+                parts.append(f"""
+                        <p class="rss-summary">{escaped_summary}</p>""")
 
-            html += """
-                    </div>"""
+            parts.append("""
+                    </div>""")
 
-        html += """
-                </div>"""
+        parts.append("""
+                </div>""")
+
+    html += "".join(parts)
 
     html += """
             </div>
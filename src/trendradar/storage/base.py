@@ -7,7 +7,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 
 
 @dataclass
@@ -493,6 +493,20 @@ class StorageBackend(ABC):
         """
         pass
 
+    def get_pushed_hashes(self, hash_list: List[str]) -> Set[str]:
+        """
+        批量查询已推送的哈希集合
+
+        默认基于 is_news_pushed_batch 实现，后端可覆盖为直接返回查询结果集合。
+
+        Args:
+            hash_list: 内容哈希值列表
+
+        Returns:
+            已推送的哈希值集合
+        """
+        return {h for h, is_pushed in self.is_news_pushed_batch(hash_list).items() if is_pushed}
+
     @abstractmethod
     def record_pushed_news(self, content_hash: str, title: str = "", url: str = "") -> bool:
         """
@@ -11,9 +11,10 @@ import asyncio
 import hashlib
 import os
 import shutil
+import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -90,9 +91,52 @@ class ImageCache:
             
         return default_path
 
-    def find_existing_cache(self, url: str) -> Optional[Path]:
-        """查找已存在的缓存文件（遍历所有日期目录）"""
+    def build_existing_index(self) -> Dict[str, Path]:
+        """
+        一次性扫描保留期内的日期目录，建立 {url_hash: 缓存路径} 索引
+
+        批量查找时以一次目录扫描代替逐个 URL 的 exists 检查；
+        命中优先级与 find_existing_cache 一致（日期越近越优先，同日按扩展名顺序）。
+        """
+        ext_rank = {ext: i for i, ext in enumerate(self.ALLOWED_MIME_TYPES.values())}
+        index: Dict[str, Path] = {}
+
+        today = datetime.now()
+        for i in range(self.retention_days + 1):
+            date_str = (today - timedelta(days=i)).strftime("%Y-%m-%d")
+            day_dir = self.base_dir / date_str
+            try:
+                entries = list(os.scandir(day_dir))
+            except OSError:
+                continue
+
+            day_index: Dict[str, tuple] = {}
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                rank = ext_rank.get(ext)
+                if rank is None:
+                    continue
+                current = day_index.get(stem)
+                if current is None or rank < current[0]:
+                    day_index[stem] = (rank, day_dir / entry.name)
+
+            for stem, (_, path) in day_index.items():
+                index.setdefault(stem, path)
+        return index
+
+    def find_existing_cache(
+        self, url: str, index: Optional[Dict[str, Path]] = None
+    ) -> Optional[Path]:
+        """
+        查找已存在的缓存文件（遍历所有日期目录）
+
+        Args:
+            url: 图片 URL
+            index: build_existing_index 生成的索引，提供时直接查表，不访问文件系统
+        """
         url_hash = hashlib.md5(url.encode("utf-8")).hexdigest()
+        if index is not None:
+            return index.get(url_hash)
         
         # 优化：优先检查最近几天的目录
         today = datetime.now()
@@ -156,10 +200,17 @@ class ImageCache:
                 # 生成最终保存路径
                 file_path = save_dir / f"{url_hash}{ext}"
                 
-                # 写入文件
+                # 先写临时文件再原子替换，静态服务不会读到写了一半的图片
                 content = response.content
-                with open(file_path, "wb") as f:
-                    f.write(content)
+                fd, tmp_path = tempfile.mkstemp(dir=save_dir, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(content)
+                    os.replace(tmp_path, file_path)
+                except BaseException:
+                    if os.path.exists(tmp_path):
+                        os.unlink(tmp_path)
+                    raise
                     
                 return str(file_path.resolve().relative_to(Path.cwd()))
                     
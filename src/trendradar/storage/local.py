@@ -11,7 +11,7 @@ import json
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
 from trendradar.utils.time import (
@@ -521,10 +521,22 @@ class LocalStorageBackend(StorageBackend):
         if not hash_list:
             return {}
 
+        pushed = self.get_pushed_hashes(hash_list)
+        return {h: h in pushed for h in hash_list}
+
+    def get_pushed_hashes(self, hash_list: List[str]) -> Set[str]:
+        """
+        批量查询已推送的哈希集合
+
+        使用 SQL IN 子句分批查询，直接返回命中的哈希集合；查询失败时返回空集合（视为均未推送）
+        """
+        if not hash_list:
+            return set()
+
         try:
             # 限制单次批量查询的最大数量，避免 SQL 语句过长
             BATCH_SIZE = 1000
-            result = {}
+            pushed: Set[str] = set()
 
             conn = self._get_history_connection()
             cursor = conn.cursor()
@@ -534,23 +546,17 @@ class LocalStorageBackend(StorageBackend):
                 batch = hash_list[i:i + BATCH_SIZE]
 
                 # 构建 SQL IN 子句
-                placeholders = ','.join(['?' for _ in batch])
+                placeholders = ','.join('?' * len(batch))
                 query = f"SELECT content_hash FROM pushed_news WHERE content_hash IN ({placeholders})"
 
                 cursor.execute(query, batch)
+                pushed.update(row[0] for row in cursor.fetchall())
 
-                # 获取已推送的哈希列表
-                pushed_hashes = {row[0] for row in cursor.fetchall()}
-
-                # 构建结果字典
-                for h in batch:
-                    result[h] = h in pushed_hashes
-
-            return result
+            return pushed
         except Exception as e:
             self.logger.error(f"[本地存储] 批量检查推送记录失败: {e}")
             # 失败时返回所有哈希都未推送（保守策略）
-            return {h: False for h in hash_list}
+            return set()
 
     def record_pushed_news(self, content_hash: str, title: str = "", url: str = "") -> bool:
         """
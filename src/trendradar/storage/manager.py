@@ -8,7 +8,7 @@
 import os
 import httpx
 import logging
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Set, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from trendradar.storage.image_cache import ImageCache
@@ -376,6 +376,10 @@ class StorageManager:
         """批量检查新闻是否已推送"""
         return self.get_backend().is_news_pushed_batch(hash_list)
 
+    def get_pushed_hashes(self, hash_list: List[str]) -> Set[str]:
+        """批量查询已推送的哈希集合"""
+        return self.get_backend().get_pushed_hashes(hash_list)
+
     def record_pushed_news(self, content_hash: str, title: str = "", url: str = "") -> bool:
         """记录已推送的新闻"""
         return self.get_backend().record_pushed_news(content_hash, title, url)
@@ -16,7 +16,7 @@ import tempfile
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 try:
     import boto3
@@ -1113,35 +1113,41 @@ class RemoteStorageBackend(StorageBackend):
         if not hash_list:
             return {}
 
+        pushed = self.get_pushed_hashes(hash_list)
+        return {h: h in pushed for h in hash_list}
+
+    def get_pushed_hashes(self, hash_list: List[str]) -> Set[str]:
+        """
+        批量查询已推送的哈希集合
+
+        使用 SQL IN 子句分批查询，直接返回命中的哈希集合；查询失败时返回空集合（视为均未推送）
+        """
+        if not hash_list:
+            return set()
+
         try:
             # 限制单次批量查询的最大数量，避免 SQL 语句过长
             BATCH_SIZE = 1000
-            result = {}
+            pushed: Set[str] = set()
 
             # 如果 hash 数量超过限制，分批查询
             for i in range(0, len(hash_list), BATCH_SIZE):
                 batch = hash_list[i:i + BATCH_SIZE]
 
                 # 构建 SQL IN 子句
-                placeholders = ','.join(['?' for _ in batch])
+                placeholders = ','.join('?' * len(batch))
                 query = f"SELECT content_hash FROM pushed_news WHERE content_hash IN ({placeholders})"
 
                 conn = self._get_connection()
                 cursor = conn.cursor()
                 cursor.execute(query, batch)
+                pushed.update(row[0] for row in cursor.fetchall())
 
-                # 获取已推送的哈希列表
-                pushed_hashes = {row[0] for row in cursor.fetchall()}
-
-                # 构建结果字典
-                for h in batch:
-                    result[h] = h in pushed_hashes
-
-            return result
+            return pushed
         except Exception as e:
             logging.getLogger('TrendRadar').info(f"[远程存储] 批量检查推送记录失败: {e}")
             # 失败时返回所有哈希都未推送（保守策略）
-            return {h: False for h in hash_list}
+            return set()
 
     def record_pushed_news(self, content_hash: str, title: str = "", url: str = "") -> bool:
         """
@@ -5,6 +5,7 @@
 
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 import pytz
@@ -171,10 +172,46 @@ def format_iso_time_friendly(
         return iso_time
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_time(iso_time: str) -> Optional[datetime]:
+    """
+    解析 ISO 格式时间为带时区的 datetime（结果缓存，同一批 RSS 中重复的时间串只解析一次）
+
+    Args:
+        iso_time: ISO 格式时间字符串，不带时区时按 UTC 处理
+
+    Returns:
+        带时区的 datetime，无法解析时返回 None
+    """
+    dt = None
+
+    # 尝试解析带时区的格式
+    if "+" in iso_time or iso_time.endswith("Z"):
+        iso_time_normalized = iso_time.replace("Z", "+00:00")
+        try:
+            dt = datetime.fromisoformat(iso_time_normalized)
+        except ValueError:
+            pass
+
+    # 尝试解析不带时区的格式（假设为 UTC）
+    if dt is None:
+        try:
+            if "T" in iso_time:
+                dt = datetime.fromisoformat(iso_time.replace("T", " ").split(".")[0])
+            else:
+                dt = datetime.fromisoformat(iso_time.split(".")[0])
+            dt = pytz.UTC.localize(dt)
+        except ValueError:
+            pass
+
+    return dt
+
+
 def is_within_days(
     iso_time: str,
     max_days: int,
     timezone: str = DEFAULT_TIMEZONE,
+    now: Optional[datetime] = None,
 ) -> bool:
     """
     检查 ISO 格式时间是否在指定天数内
@@ -187,6 +224,7 @@ def is_within_days(
             - max_days > 0: 正常过滤，保留 N 天内的文章
             - max_days <= 0: 禁用过滤，保留所有文章
         timezone: 时区名称（用于获取当前时间）
+        now: 预先获取的当前时间（带时区），批量判断时传入以避免逐条解析时区
 
     Returns:
         True 如果时间在指定天数内（应保留），False 如果超过指定天数（应过滤）
@@ -199,33 +237,14 @@ def is_within_days(
         return True  # max_days=0 表示禁用过滤
 
     try:
-        dt = None
-
-        # 尝试解析带时区的格式
-        if "+" in iso_time or iso_time.endswith("Z"):
-            iso_time_normalized = iso_time.replace("Z", "+00:00")
-            try:
-                dt = datetime.fromisoformat(iso_time_normalized)
-            except ValueError:
-                pass
-
-        # 尝试解析不带时区的格式（假设为 UTC）
-        if dt is None:
-            try:
-                if "T" in iso_time:
-                    dt = datetime.fromisoformat(iso_time.replace("T", " ").split(".")[0])
-                else:
-                    dt = datetime.fromisoformat(iso_time.split(".")[0])
-                dt = pytz.UTC.localize(dt)
-            except ValueError:
-                pass
-
+        dt = _parse_iso_time(iso_time)
         if dt is None:
             # 无法解析时间，保留文章
             return True
 
         # 获取当前时间（配置的时区，带时区信息）
-        now = get_configured_time(timezone)
+        if now is None:
+            now = get_configured_time(timezone)
 
         # 计算时间差（两个带时区的 datetime 相减会自动处理时区差异）
         diff = now - dt
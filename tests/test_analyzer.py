@@ -6,6 +6,7 @@
 import pytest
 from trendradar.core.analyzer import (
     calculate_news_weight,
+    calculate_news_weights_batch,
     WordFrequencyConfig,
 )
 from trendradar.core.constants import WEIGHT
@@ -75,6 +76,19 @@ class TestCalculateNewsWeight:
         # 验证权重计算成功
         assert custom_weight >= 0
 
+    def test_batch_matches_single(self):
+        """测试批量计算结果与逐条计算一致"""
+        titles = [
+            {"ranks": [1, 2, 3], "count": 3},
+            {"ranks": [], "count": 0},
+            {"ranks": [8, 40], "count": 12},
+            {"ranks": [2]},
+        ]
+        weight_config = {"RANK_WEIGHT": 0.5, "FREQUENCY_WEIGHT": 0.3, "HOTNESS_WEIGHT": 0.2}
+
+        expected = [calculate_news_weight(t, 5, weight_config) for t in titles]
+        assert calculate_news_weights_batch(titles, 5, weight_config) == expected
+
 
 class TestWordFrequencyConfig:
     """测试 WordFrequencyConfig 类"""
@@ -141,5 +155,77 @@ def test_helper_functions():
     assert result["display_name"] == "显示名称"
 
 
+def test_word_matches_uses_lowercase_form():
+    """测试预计算小写形式的子字符串匹配"""
+    from trendradar.core.frequency import _parse_word, _word_matches
+
+    parsed = _parse_word("OpenAI")
+    assert parsed["word_lower"] == "openai"
+    assert _word_matches(parsed, "openai 发布新模型")
+    # 兼容未包含 word_lower 的旧格式字典
+    assert _word_matches({"word": "GPT", "is_regex": False}, "gpt-5 上线")
+
+
+def test_load_frequency_words_cached_by_mtime(tmp_path):
+    """测试频率词按文件修改时间缓存"""
+    import os
+    from trendradar.core.frequency import load_frequency_words
+
+    words_file = tmp_path / "frequency_words.txt"
+    words_file.write_text("AI\n+芯片", encoding="utf-8")
+
+    first = load_frequency_words(str(words_file))
+    second = load_frequency_words(str(words_file))
+    assert first == second
+    assert first[0][0] is second[0][0]  # 复用已解析的词组
+
+    words_file.write_text("AI\n\n机器人", encoding="utf-8")
+    stat = words_file.stat()
+    os.utime(words_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    word_groups, _, _ = load_frequency_words(str(words_file))
+    assert [g["group_key"] for g in word_groups] == ["AI", "机器人"]
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_keyword_matcher_groups(monkeypatch, use_automaton):
+    """测试批量匹配器的词组归属（含回退路径）及 matches_word_groups 包装"""
+    from trendradar.core import frequency
+    from trendradar.core.frequency import KeywordMatcher, _parse_word, matches_word_groups
+
+    if not use_automaton:
+        monkeypatch.setattr(frequency, "ahocorasick", None)
+    elif frequency.ahocorasick is None:
+        pytest.skip("未安装 pyahocorasick")
+
+    word_groups = [
+        {"required": [_parse_word("芯片")], "normal": [_parse_word("华为"), _parse_word("苹果")]},
+        {"required": [], "normal": [_parse_word("/gpt-?\\d/"), _parse_word("OpenAI")]},
+    ]
+    filter_words = [_parse_word("广告")]
+    global_filters = ["震惊"]
+    matcher = KeywordMatcher(word_groups, filter_words, global_filters)
+
+    # 标题 -> 期望命中的词组下标（None 表示未匹配）
+    expected = {
+        "华为发布新芯片": 0, "苹果芯片量产": 0, "苹果公司财报": None,
+        "OpenAI 推出 GPT5": 1, "GPT-4 评测": 1, "openai 广告合作": None,
+        "震惊！芯片华为": None, "": None, "   ": None, None: None, "普通新闻": None,
+    }
+    for title, idx in expected.items():
+        group = matcher.find_group(title)
+        assert group is (None if idx is None else word_groups[idx]), title
+        assert matcher.matches(title) is (idx is not None), title
+        assert matches_word_groups(title, word_groups, filter_words, global_filters) is (idx is not None), title
+
+    # 未配置词组时匹配全部（全局过滤仍生效），但不归属任何词组
+    assert matches_word_groups("普通新闻", [], [], global_filters)
+    assert not matches_word_groups("震惊！普通新闻", [], [], global_filters)
+    assert KeywordMatcher([], []).find_group("普通新闻") is None
+
+    # 重复标题复用缓存的匹配结果
+    assert matcher.matches("华为发布新芯片") is True
+    assert "华为发布新芯片" in matcher._verdicts
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -8,6 +8,7 @@ from trendradar.core.config import (
     parse_multi_account_config,
     validate_paired_configs,
 )
+from trendradar.core.loader import load_config, clear_config_cache
 
 
 class TestParseMultiAccountConfig:
@@ -109,5 +110,62 @@ def test_required_fields_validation():
     pass
 
 
+def test_load_config_cached(tmp_path, monkeypatch):
+    """测试配置解析缓存：每次返回独立字典，环境变量覆盖不被缓存"""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "app:\n  timezone: Asia/Shanghai\nplatforms:\n  - id: zhihu\n", encoding="utf-8"
+    )
+
+    clear_config_cache()
+    try:
+        first = load_config(str(config_file))
+        second = load_config(str(config_file))
+        assert second is not first
+        assert second == first
+
+        first["PLATFORMS"].append({"id": "x"})
+        assert load_config(str(config_file))["PLATFORMS"] == [{"id": "zhihu"}]
+
+        monkeypatch.setenv("LLM_MODEL", "custom-model")
+        assert load_config(str(config_file))["LLM"]["MODEL"] == "custom-model"
+    finally:
+        clear_config_cache()
+
+
+def test_llm_service_reads_loaded_config(tmp_path, monkeypatch):
+    """测试 LLMService 能读取 load_config 输出的 LLM 配置"""
+    from trendradar.core.llm_service import LLMService
+
+    for key in ("LLM_ENABLED", "LLM_PROVIDER", "LLM_BASE_URL", "LLM_API_KEY", "LLM_MODEL"):
+        monkeypatch.delenv(key, raising=False)
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "llm:\n"
+        "  enabled: true\n"
+        "  provider: openai\n"
+        "  base_url: https://llm.example.com/v1\n"
+        "  model: test-model\n"
+        "  batch_size: 20\n"
+        "  max_concurrency: 8\n"
+        "  score_threshold: 7.5\n",
+        encoding="utf-8",
+    )
+
+    clear_config_cache()
+    try:
+        llm = LLMService(load_config(str(config_file)))
+    finally:
+        clear_config_cache()
+
+    assert llm.is_enabled()
+    assert llm.base_url == "https://llm.example.com/v1"
+    assert llm.model == "test-model"
+    assert llm.batch_size == 20
+    assert llm.max_concurrency == 8
+    assert llm.config["SCORE_THRESHOLD"] == 7.5
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
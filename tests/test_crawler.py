@@ -172,5 +172,36 @@ async def test_concurrent_fetch():
         assert all(r[0] is not None for r in results)  # 所有数据都成功获取
 
 
+def test_rss_parser_max_items():
+    """测试 RSS 解析达到条目上限后提前结束"""
+    from trendradar.crawler.rss.parser import RSSParser
+
+    entries = "".join(
+        f"<item><title>标题 {i}</title><link>https://example.com/{i}</link></item>"
+        for i in range(10)
+    )
+    content = f'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>{entries}</channel></rss>'
+
+    parser = RSSParser()
+    assert len(parser.parse(content)) == 10
+    items = parser.parse(content, max_items=3)
+    assert [item.title for item in items] == ["标题 0", "标题 1", "标题 2"]
+
+
+def test_detect_feed_type():
+    """测试 Feed 类型前缀探测"""
+    from trendradar.crawler.rss.parser import RSSParser, detect_feed_type
+
+    assert detect_feed_type('<?xml version="1.0"?><rss version="2.0">') == "rss"
+    assert detect_feed_type('<feed xmlns="http://www.w3.org/2005/Atom">') == "atom"
+    assert detect_feed_type('<rdf:RDF xmlns:rdf="...">') == "rdf"
+    assert detect_feed_type('\ufeff  {"version": "https://jsonfeed.org/version/1.1"}') == "json"
+    assert detect_feed_type("<html></html>") == "unknown"
+
+    content = '{"version": "https://jsonfeed.org/version/1.1", "items": [{"id": "1", "title": "JSON 标题", "url": "https://example.com/1"}]}'
+    items = RSSParser().parse(content)
+    assert [item.title for item in items] == ["JSON 标题"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -112,23 +112,37 @@ class TestDeduplication:
             mock_storage = MagicMock()
 
             # 模拟批量查询返回所有 hash 都未推送
-            mock_storage.is_news_pushed_batch.return_value = {
-                "hash1": False,
-                "hash2": False,
-                "hash3": False
-            }
+            mock_storage.get_pushed_hashes.return_value = set()
 
             mock_get_storage.return_value = mock_storage
 
             context = AppContext(mock_config)
             filtered_data, items_to_record = context.deduplicate_report_data(sample_report_data)
 
-            # 验证批量查询被调用
-            assert mock_storage.is_news_pushed_batch.called
+            # 验证热榜与新增列表合并为一次批量查询
+            assert mock_storage.get_pushed_hashes.call_count == 1
 
             # 验证结果
             assert len(items_to_record) == 3  # 两条新闻 + 一条新增新闻 = 3
 
+    def test_filtered_stats_grouped_per_stat(self, mock_config, sample_report_data):
+        """测试未推送新闻按原 stat 归组，不产生重复分组"""
+        with patch('trendradar.context.get_storage_manager') as mock_get_storage:
+            mock_storage = MagicMock()
+            mock_storage.get_pushed_hashes.return_value = set()
+            mock_get_storage.return_value = mock_storage
+
+            context = AppContext(mock_config)
+            filtered_data, _ = context.deduplicate_report_data(sample_report_data)
+
+            stats = filtered_data["stats"]
+            assert len(stats) == 1
+            assert stats[0]["word"] == "测试"
+            assert stats[0]["count"] == 2
+            assert [t["title"] for t in stats[0]["titles"]] == ["测试新闻1", "测试新闻2"]
+            # 原始数据不应被修改
+            assert len(sample_report_data["stats"][0]["titles"]) == 2
+
     def test_deduplicate_rss_data(self, mock_config):
         """测试 RSS 数据去重"""
         rss_items = [
@@ -148,10 +162,7 @@ class TestDeduplication:
             mock_storage = MagicMock()
 
             # 模拟批量查询返回第一条已推送，第二条未推送
-            mock_storage.is_news_pushed_batch.return_value = {
-                "hash1": True,
-                "hash2": False
-            }
+            mock_storage.get_pushed_hashes.return_value = {"hash1"}
 
             mock_get_storage.return_value = mock_storage
 
@@ -168,10 +179,7 @@ class TestDeduplication:
                 rss_items_with_hash.append(item)
 
             # 重新设置批量查询返回值
-            mock_storage.is_news_pushed_batch.return_value = {
-                rss_items_with_hash[0]["hash"]: True,
-                rss_items_with_hash[1]["hash"]: False
-            }
+            mock_storage.get_pushed_hashes.return_value = {rss_items_with_hash[0]["hash"]}
 
             filtered_items, items_to_record = context.deduplicate_rss_data(rss_items_with_hash)
 
@@ -207,5 +215,28 @@ def test_record_pushed_items():
         assert mock_storage.record_pushed_news.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_http_client_shared_between_contexts(mock_config, monkeypatch):
+    """测试多个上下文共享 HTTP 客户端，最后一个释放时才关闭"""
+    # 隔离其他用例遗留的共享客户端引用
+    monkeypatch.setattr("trendradar.context._shared_http_client", None)
+    monkeypatch.setattr("trendradar.context._shared_http_client_refs", 0)
+
+    ctx1 = AppContext(mock_config)
+    ctx2 = AppContext(mock_config)
+    client = ctx1.http_client
+    assert ctx2.http_client is client
+
+    await ctx1.aclose()
+    assert not client.is_closed
+
+    await ctx2.aclose()
+    assert client.is_closed
+
+    ctx3 = AppContext(mock_config)
+    assert ctx3.http_client is not client
+    await ctx3.aclose()
+
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
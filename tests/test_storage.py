@@ -41,3 +41,12 @@ def test_storage_migration(tmp_path):
     conn.close()
     
     assert "image_url" in columns
+
+
+def test_pushed_hashes_batch(tmp_path):
+    backend = LocalStorageBackend(data_dir=str(tmp_path))
+    assert backend.record_pushed_news("h1", "t1", "u1")
+
+    assert backend.get_pushed_hashes(["h1", "h2"]) == {"h1"}
+    assert backend.get_pushed_hashes([]) == set()
+    assert backend.is_news_pushed_batch(["h1", "h2"]) == {"h1": True, "h2": False}